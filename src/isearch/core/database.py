@@ -5,7 +5,7 @@ import sqlite3
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from isearch.utils.constants import DEFAULT_DB_PATH
 
@@ -13,13 +13,28 @@ from isearch.utils.constants import DEFAULT_DB_PATH
 class DatabaseManager:
     """Manages SQLite database operations for file metadata."""
 
-    def __init__(self, db_path: Optional[Path] = None) -> None:
-        self.db_path = db_path or DEFAULT_DB_PATH
+    def __init__(self, db_path: Optional[Union[str, Path]] = None) -> None:
         self.logger = logging.getLogger(__name__)
         self._lock = threading.Lock()
-
-        # Ensure data directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fts_enabled = False
+        self._memory_uri: Optional[str] = None
+        self._keepalive: Optional[sqlite3.Connection] = None
+
+        if db_path == ":memory:":
+            # Every _get_connection call opens a fresh connection, so a
+            # plain :memory: database would vanish between calls; route
+            # through a per-instance shared-cache URI and hold one
+            # keepalive connection for the lifetime of the manager.
+            # Tests use this to skip all disk I/O.
+            self._memory_uri = f"file:isearch-mem-{id(self)}?mode=memory&cache=shared"
+            self._keepalive = sqlite3.connect(
+                self._memory_uri, uri=True, check_same_thread=False
+            )
+            self.db_path = Path(db_path)
+        else:
+            self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+            # Ensure data directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize database
         self._initialize_database()
@@ -30,8 +45,7 @@ class DatabaseManager:
             cursor = conn.cursor()
 
             # Create main files table
-            cursor.execute(
-                """
+            cursor.execute("""
                 CREATE TABLE IF NOT EXISTS files (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     path TEXT NOT NULL UNIQUE,
@@ -42,7 +56,7 @@ class DatabaseManager:
                     created_date REAL,
                     file_type TEXT NOT NULL,
                     extension TEXT,
-                    hash TEXT,
+                    hash BLOB,
                     perceptual_hash TEXT,
                     average_hash TEXT,
                     difference_hash TEXT,
@@ -56,72 +70,52 @@ class DatabaseManager:
                     created_at REAL DEFAULT (datetime('now')),
                     updated_at REAL DEFAULT (datetime('now'))
                 )
-            """
-            )
+            """)
 
             # Create indexes for performance
-            cursor.execute(
-                """
+            cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_files_filename
                 ON files(filename)
-            """
-            )
-            cursor.execute(
-                """
+            """)
+            cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_files_path
                 ON files(path)
-            """
-            )
-            cursor.execute(
-                """
+            """)
+            cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_files_directory
                 ON files(directory)
-            """
-            )
-            cursor.execute(
-                """
+            """)
+            cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_files_type
                 ON files(file_type)
-            """
-            )
-            cursor.execute(
-                """
+            """)
+            cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_files_size
                 ON files(size)
-            """
-            )
-            cursor.execute(
-                """
+            """)
+            cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_files_modified
                 ON files(modified_date)
-            """
-            )
-            cursor.execute(
-                """
+            """)
+            cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_files_extension
                 ON files(extension)
-            """
-            )
+            """)
 
             # CRITICAL: Hash index for duplicate detection performance
-            cursor.execute(
-                """
+            cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_files_hash
                 ON files(hash)
-            """
-            )
+            """)
 
             # Composite index for size+name duplicate detection
-            cursor.execute(
-                """
+            cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_files_size_filename
                 ON files(size, filename)
-            """
-            )
+            """)
 
             # Create scan_sessions table for tracking scan operations
-            cursor.execute(
-                """
+            cursor.execute("""
                 CREATE TABLE IF NOT EXISTS scan_sessions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     start_time REAL NOT NULL,
@@ -136,8 +130,74 @@ class DatabaseManager:
                     created_at REAL DEFAULT (datetime('now')),
                     updated_at REAL DEFAULT (datetime('now'))
                 )
-            """
-            )
+            """)
+
+            # Migrate hashes stored by older versions as 64-char hex
+            # strings to raw 32-byte blobs (SQLite columns keep their
+            # per-value type, so both can coexist until converted).
+            # Runs before the FTS triggers exist so the first upgrade's
+            # UPDATEs cannot fire them against a not-yet-built index
+            cursor.execute("SELECT id, hash FROM files WHERE typeof(hash) = 'text'")
+            legacy_rows: List[tuple] = []
+            for row_id, hex_hash in cursor.fetchall():
+                try:
+                    legacy_rows.append((bytes.fromhex(hex_hash), row_id))
+                except ValueError:
+                    legacy_rows.append((None, row_id))
+            if legacy_rows:
+                cursor.executemany(
+                    "UPDATE files SET hash = ? WHERE id = ?", legacy_rows
+                )
+                self.logger.info(
+                    "Migrated %s legacy hex hashes to blobs", len(legacy_rows)
+                )
+
+            # Full-text index over filename and path; the trigram
+            # tokenizer serves substring queries from the index instead
+            # of a LIKE '%...%' table scan. Triggers keep it in sync;
+            # recursive_triggers (set per connection) makes the implicit
+            # delete of INSERT OR REPLACE fire the delete trigger too.
+            try:
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'files_fts'"
+                )
+                fts_exists = cursor.fetchone() is not None
+                cursor.executescript("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS files_fts USING fts5(
+                        filename, path,
+                        content='files', content_rowid='id',
+                        tokenize='trigram'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS files_fts_insert
+                    AFTER INSERT ON files BEGIN
+                        INSERT INTO files_fts(rowid, filename, path)
+                        VALUES (new.id, new.filename, new.path);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS files_fts_delete
+                    AFTER DELETE ON files BEGIN
+                        INSERT INTO files_fts(files_fts, rowid, filename, path)
+                        VALUES ('delete', old.id, old.filename, old.path);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS files_fts_update
+                    AFTER UPDATE ON files BEGIN
+                        INSERT INTO files_fts(files_fts, rowid, filename, path)
+                        VALUES ('delete', old.id, old.filename, old.path);
+                        INSERT INTO files_fts(rowid, filename, path)
+                        VALUES (new.id, new.filename, new.path);
+                    END;
+                """)
+                if not fts_exists:
+                    # First creation over an existing database: backfill
+                    # the index from the files table, or upgrades would
+                    # search an empty index (and the delete/update
+                    # triggers would reference rows it never held)
+                    cursor.execute("INSERT INTO files_fts(files_fts) VALUES('rebuild')")
+                self._fts_enabled = True
+            except sqlite3.OperationalError as e:
+                # Older SQLite without FTS5/trigram: LIKE search remains
+                self.logger.warning("Full-text index unavailable: %s", e)
+                self._fts_enabled = False
 
             conn.commit()
             self.logger.info("Database initialized successfully")
@@ -146,55 +206,85 @@ class DatabaseManager:
     def _get_connection(self):
         """Get a database connection with proper locking."""
         with self._lock:
-            conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            if self._memory_uri is not None:
+                conn = sqlite3.connect(
+                    self._memory_uri, uri=True, timeout=30.0, check_same_thread=False
+                )
+            else:
+                conn = sqlite3.connect(
+                    self.db_path, timeout=30.0, check_same_thread=False
+                )
             conn.row_factory = sqlite3.Row  # Enable column access by name
             conn.execute("PRAGMA foreign_keys=ON")
             conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent access
+            # INSERT OR REPLACE deletes the old row implicitly; without
+            # this pragma that delete skips the FTS delete trigger and
+            # leaves a stale index entry behind on every upsert
+            conn.execute("PRAGMA recursive_triggers=ON")
             try:
                 yield conn
             finally:
                 conn.close()
 
+    _INSERT_FILE_SQL = """
+        INSERT OR REPLACE INTO files (
+            path, filename, directory, size, modified_date,
+            created_date, file_type, extension, hash,
+            perceptual_hash, average_hash, difference_hash,
+            quality_score, is_ai_enhanced, ai_confidence, media_analysis,
+            is_hidden, is_symlink, scan_date, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+            datetime('now'), datetime('now'))
+    """
+
+    @staticmethod
+    def _file_row(file_info: Dict[str, Any]) -> tuple:
+        """Build the parameter tuple for a files-table insert."""
+        return (
+            str(file_info["path"]),
+            file_info["filename"],
+            str(file_info["directory"]),
+            file_info["size"],
+            file_info["modified_date"],
+            file_info.get("created_date"),
+            file_info["file_type"],
+            file_info.get("extension", ""),
+            file_info.get("hash"),
+            file_info.get("perceptual_hash"),
+            file_info.get("average_hash"),
+            file_info.get("difference_hash"),
+            file_info.get("quality_score", 0.0),
+            file_info.get("is_ai_enhanced", False),
+            file_info.get("ai_confidence", 0.0),
+            file_info.get("media_analysis"),
+            file_info.get("is_hidden", False),
+            file_info.get("is_symlink", False),
+        )
+
     def add_file(self, file_info: Dict[str, Any]) -> int:
         """Add a file record to the database."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute(self._INSERT_FILE_SQL, self._file_row(file_info))
+            conn.commit()
+            return cursor.lastrowid
 
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO files (
-                    path, filename, directory, size, modified_date,
-                    created_date, file_type, extension, hash,
-                    perceptual_hash, average_hash, difference_hash,
-                    quality_score, is_ai_enhanced, ai_confidence, media_analysis,
-                    is_hidden, is_symlink, scan_date, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                    datetime('now'), datetime('now'))
-            """,
-                (
-                    str(file_info["path"]),
-                    file_info["filename"],
-                    str(file_info["directory"]),
-                    file_info["size"],
-                    file_info["modified_date"],
-                    file_info.get("created_date"),
-                    file_info["file_type"],
-                    file_info.get("extension", ""),
-                    file_info.get("hash"),
-                    file_info.get("perceptual_hash"),
-                    file_info.get("average_hash"),
-                    file_info.get("difference_hash"),
-                    file_info.get("quality_score", 0.0),
-                    file_info.get("is_ai_enhanced", False),
-                    file_info.get("ai_confidence", 0.0),
-                    file_info.get("media_analysis"),
-                    file_info.get("is_hidden", False),
-                    file_info.get("is_symlink", False),
-                ),
-            )
+    def add_files(self, file_infos: Iterable[Dict[str, Any]]) -> int:
+        """Add many file records in one transaction.
+
+        One executemany under a single commit amortizes the B-tree page
+        writes and WAL sync across the batch, instead of paying them
+        per row as add_file does.
+        """
+        rows = [self._file_row(file_info) for file_info in file_infos]
+        if not rows:
+            return 0
 
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(self._INSERT_FILE_SQL, rows)
             conn.commit()
-            return cursor.lastrowid
+            return len(rows)
 
     def get_file_by_path(self, path: Union[str, Path]) -> Optional[Dict[str, Any]]:
         """Get file record by path."""
@@ -204,7 +294,7 @@ class DatabaseManager:
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def update_file_hash(self, path: Union[str, Path], hash_value: str) -> bool:
+    def update_file_hash(self, path: Union[str, Path], hash_value: bytes) -> bool:
         """Update hash for an existing file."""
         try:
             with self._get_connection() as conn:
@@ -216,7 +306,7 @@ class DatabaseManager:
                 )
                 return cursor.rowcount > 0
         except Exception as e:
-            self.logger.error(f"Failed to update hash for {path}: {e}")
+            self.logger.error("Failed to update hash for %s: %s", path, e)
             return False
 
     def search_files(
@@ -243,13 +333,20 @@ class DatabaseManager:
 
             # Text search
             if query:
+                search_field = "path" if search_path else "filename"
                 if use_regex:
                     # For regex, we'll do post-processing in search engine
                     # Just do a broad search here to get candidates
-                    search_field = "path" if search_path else "filename"
                     conditions.append(f"{search_field} IS NOT NULL")
+                elif self._fts_enabled and len(query) >= 3:
+                    # Trigram FTS needs three characters; shorter
+                    # queries keep the LIKE path below
+                    conditions.append(
+                        "id IN (SELECT rowid FROM files_fts" " WHERE files_fts MATCH ?)"
+                    )
+                    escaped = query.replace('"', '""')
+                    params.append(f'{search_field}: "{escaped}"')
                 else:
-                    search_field = "path" if search_path else "filename"
                     conditions.append(f"{search_field} LIKE ? COLLATE NOCASE")
                     params.append(f"%{query}%")
 
@@ -308,24 +405,20 @@ class DatabaseManager:
             total_size = cursor.fetchone()["total_size"] or 0
 
             # File type breakdown
-            cursor.execute(
-                """
+            cursor.execute("""
                 SELECT file_type, COUNT(*) as count, SUM(size) as size
                 FROM files
                 GROUP BY file_type
                 ORDER BY count DESC
-            """
-            )
+            """)
             file_types = [dict(row) for row in cursor.fetchall()]
 
             # Recent files
-            cursor.execute(
-                """
+            cursor.execute("""
                 SELECT COUNT(*) as recent_count
                 FROM files
                 WHERE scan_date >= datetime('now', '-7 days')
-            """
-            )
+            """)
             recent_files = cursor.fetchone()["recent_count"]
 
             return {
@@ -355,7 +448,7 @@ class DatabaseManager:
 
             conn.commit()
             if removed_count > 0:
-                self.logger.info(f"Removed {removed_count} missing files")
+                self.logger.info("Removed %s missing files", removed_count)
 
             return removed_count
 
@@ -405,7 +498,28 @@ class DatabaseManager:
             removed = cursor.rowcount > 0
 
             if removed:
-                self.logger.info(f"Removed file from database: {path_str}")
+                self.logger.info("Removed file from database: %s", path_str)
+
+            return removed
+
+    def remove_files_by_paths(self, file_paths: List[Union[str, Path]]) -> int:
+        """Remove multiple files from the database in a single transaction."""
+        if not file_paths:
+            return 0
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.executemany(
+                "DELETE FROM files WHERE path = ?",
+                [(str(path),) for path in file_paths],
+            )
+
+            conn.commit()
+            removed = cursor.rowcount
+
+            if removed > 0:
+                self.logger.info("Removed %s files from database", removed)
 
             return removed
 
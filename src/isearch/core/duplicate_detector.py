@@ -1,12 +1,28 @@
 """Advanced duplicate detection algorithms."""
 
 import logging
+import re
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from isearch.core.database import DatabaseManager
 from isearch.utils.file_utils import calculate_file_hash, string_similarity
 
+# Copy indicators stripped from filenames before comparison, compiled
+# once in application order; smart detection calls this per file
+_COPY_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r" \(\d+\)",  # (1), (2), etc.
+        r" - copy",
+        r"_copy",
+        r" copy",
+        r"\.bak$",
+        r"\.backup$",
+    )
+)
+
 
 class DuplicateDetector:
     """Advanced duplicate detection with multiple algorithms."""
@@ -63,21 +79,26 @@ class DuplicateDetector:
     def _find_by_size_and_name(
         self, files: List[Dict[str, Any]]
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """Find duplicates by matching size and filename."""
-        groups: Dict[Any, List[Dict[str, Any]]] = {}
+        """Find duplicates by matching size and filename.
 
-        for file_record in files:
-            key = (file_record["size"], file_record["filename"])
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(file_record)
+        A counting pre-pass identifies colliding keys first, so record
+        lists are only built for actual duplicate groups instead of one
+        per file - most files have a unique (size, name).
+        """
+        key_counts = Counter(
+            (file_record["size"], file_record["filename"]) for file_record in files
+        )
 
-        # Filter to only groups with multiple files
-        duplicates = {
-            f"{size}_{filename}": file_list
-            for (size, filename), file_list in groups.items()
-            if len(file_list) > 1
-        }
+        duplicates: Dict[str, List[Dict[str, Any]]] = {}
+        for file_record in files:
+            size = file_record["size"]
+            filename = file_record["filename"]
+            if key_counts[(size, filename)] < 2:
+                continue
+            group_key = f"{size}_{filename}"
+            if group_key not in duplicates:
+                duplicates[group_key] = []
+            duplicates[group_key].append(file_record)
 
         return duplicates
 
@@ -105,9 +126,11 @@ class DuplicateDetector:
         total_to_hash = len(files_needing_hashes)
         for i, file_record in enumerate(files_needing_hashes):
             if i % 10 == 0:  # Log progress every 10 files
-                self.logger.debug(f"Calculating hashes: {i+1}/{total_to_hash}")
+                self.logger.debug("Calculating hashes: %s/%s", i + 1, total_to_hash)
 
-            hash_value = self._calculate_file_hash(file_record["path"])
+            hash_value = self._calculate_file_hash(
+                file_record["path"], file_record.get("size")
+            )
             if hash_value:
                 file_record["hash"] = hash_value
                 files_with_hashes.append(file_record)
@@ -116,24 +139,25 @@ class DuplicateDetector:
                 try:
                     self.db_manager.update_file_hash(file_record["path"], hash_value)
                 except Exception as e:
-                    self.logger.debug(f"Failed to update hash in database: {e}")
+                    self.logger.debug("Failed to update hash in database: %s", e)
 
         # Group by hash
-        groups: Dict[str, List[Dict[str, Any]]] = {}
+        groups: Dict[bytes, List[Dict[str, Any]]] = {}
         for file_record in files_with_hashes:
             hash_key = file_record["hash"]
             if hash_key not in groups:
                 groups[hash_key] = []
             groups[hash_key].append(file_record)
 
-        # Filter to only groups with multiple files
+        # Filter to only groups with multiple files; keys go out as
+        # hex so group names stay printable
         duplicates = {
-            hash_key: file_list
+            hash_key.hex(): file_list
             for hash_key, file_list in groups.items()
             if len(file_list) > 1
         }
 
-        self.logger.info(f"Found {len(duplicates)} hash-based duplicate groups")
+        self.logger.info("Found %s hash-based duplicate groups", len(duplicates))
         return duplicates
 
     def _find_smart_duplicates(
@@ -179,23 +203,42 @@ class DuplicateDetector:
     def _find_by_content_hash(
         self, files: List[Dict[str, Any]]
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """Find duplicates by calculating content hashes."""
-        content_hashes: Dict[str, List[Dict[str, Any]]] = {}
+        """Find duplicates by calculating content hashes.
+
+        Files with identical content have identical sizes, so only
+        files whose size collides with another's get hashed; unique
+        sizes are ruled out without touching the disk.
+        """
+        size_groups: Dict[int, List[Dict[str, Any]]] = {}
 
         for file_record in files:
             # Skip very large files to avoid performance issues
             if file_record["size"] > 100 * 1024 * 1024:  # 100MB limit
                 continue
 
-            content_hash = self._calculate_file_hash(file_record["path"])
-            if content_hash:
-                if content_hash not in content_hashes:
-                    content_hashes[content_hash] = []
-                content_hashes[content_hash].append(file_record)
+            size = file_record["size"]
+            if size not in size_groups:
+                size_groups[size] = []
+            size_groups[size].append(file_record)
+
+        content_hashes: Dict[bytes, List[Dict[str, Any]]] = {}
+
+        for size_group in size_groups.values():
+            if len(size_group) < 2:
+                continue
+
+            for file_record in size_group:
+                content_hash = self._calculate_file_hash(
+                    file_record["path"], file_record["size"]
+                )
+                if content_hash:
+                    if content_hash not in content_hashes:
+                        content_hashes[content_hash] = []
+                    content_hashes[content_hash].append(file_record)
 
         # Filter to groups with duplicates
         duplicates = {
-            f"content_{hash_key[:8]}": file_list
+            f"content_{hash_key.hex()[:8]}": file_list
             for hash_key, file_list in content_hashes.items()
             if len(file_list) > 1
         }
@@ -208,19 +251,8 @@ class DuplicateDetector:
         base = filename.lower()
 
         # Remove copy indicators
-        copy_patterns = [
-            r" \(\d+\)",  # (1), (2), etc.
-            r" - copy",
-            r"_copy",
-            r" copy",
-            r"\.bak$",
-            r"\.backup$",
-        ]
-
-        import re
-
-        for pattern in copy_patterns:
-            base = re.sub(pattern, "", base)
+        for pattern in _COPY_PATTERNS:
+            base = pattern.sub("", base)
 
         # Remove extension for comparison
         return Path(base).stem
@@ -267,8 +299,11 @@ class DuplicateDetector:
         # Compare with cluster representative (first file)
         representative = cluster[0]
 
+        # Name is weighted 0.5 against the 0.7 cluster threshold, so
+        # unless name similarity reaches 0.4 the total cannot pass and
+        # the bound check can reject the pair without cache traffic
         name_similarity = self._string_similarity(
-            file_record["filename"], representative["filename"]
+            file_record["filename"], representative["filename"], min_threshold=0.4
         )
 
         size_similarity = self._size_similarity(
@@ -282,9 +317,9 @@ class DuplicateDetector:
         # Weighted average
         return name_similarity * 0.5 + size_similarity * 0.3 + type_similarity * 0.2
 
-    def _string_similarity(self, s1: str, s2: str) -> float:
+    def _string_similarity(self, s1: str, s2: str, min_threshold: float = 0.0) -> float:
         """Calculate string similarity using unified utility."""
-        return string_similarity(s1, s2)
+        return string_similarity(s1, s2, min_threshold)
 
     def _size_similarity(self, size1: int, size2: int) -> float:
         """Calculate size similarity."""
@@ -297,9 +332,15 @@ class DuplicateDetector:
         ratio = min(size1, size2) / max(size1, size2)
         return ratio
 
-    def _calculate_file_hash(self, file_path: str) -> Optional[str]:
-        """Calculate SHA-256 hash of file content using unified utility."""
-        return calculate_file_hash(file_path)
+    def _calculate_file_hash(
+        self, file_path: str, file_size: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Calculate SHA-256 hash of file content using unified utility.
+
+        file_size forwards the size already recorded in the database,
+        saving a stat per hashed file.
+        """
+        return calculate_file_hash(file_path, file_size=file_size)
 
     def _filter_files_by_directories(
         self, files: List[Dict[str, Any]], directories: List[str]
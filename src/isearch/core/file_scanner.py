@@ -2,9 +2,13 @@
 
 import fnmatch
 import logging
+import os
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Pattern
 
 from isearch.core.database import DatabaseManager
 from isearch.utils.constants import get_file_type
@@ -19,6 +23,7 @@ class FileScanner:
         self.logger = logging.getLogger(__name__)
         self._should_stop = False
         self._progress_callback: Optional[Callable[[int, int, str], None]] = None
+        self._exclude_re: Optional[Pattern[str]] = None
 
     def set_progress_callback(self, callback: Callable[[int, int, str], None]) -> None:
         """Set callback for progress updates."""
@@ -56,6 +61,17 @@ class FileScanner:
         """
         self._should_stop = False
         exclude_patterns = exclude_patterns or []
+        # Translate the glob patterns into one alternation compiled up
+        # front; the per-file check is then a single regex match rather
+        # than an fnmatch call per pattern
+        if exclude_patterns:
+            self._exclude_re = re.compile(
+                "|".join(
+                    f"(?:{fnmatch.translate(pattern)})" for pattern in exclude_patterns
+                )
+            )
+        else:
+            self._exclude_re = None
 
         # Start scan session
         session_id = self.db_manager.start_scan_session(directories)
@@ -72,16 +88,30 @@ class FileScanner:
         }
 
         try:
-            for directory in directories:
+            # Each configured root scans on its own thread: traversal is
+            # dominated by getdents/stat waits, which overlap well, and
+            # the database serializes writes behind its own lock. Every
+            # worker fills a private stats dict that is merged under a
+            # lock when its subtree completes.
+            stats_lock = threading.Lock()
+
+            def scan_root(directory: str) -> None:
                 if self._should_stop:
-                    break
+                    return
 
                 dir_path = Path(directory)
                 if not dir_path.exists():
-                    self.logger.warning(f"Directory does not exist: {directory}")
-                    continue
-
-                self.logger.info(f"Scanning directory: {directory}")
+                    self.logger.warning("Directory does not exist: %s", directory)
+                    return
+
+                self.logger.info("Scanning directory: %s", directory)
+                local_stats: Dict[str, Any] = {
+                    "files_scanned": 0,
+                    "files_added": 0,
+                    "files_updated": 0,
+                    "errors": 0,
+                    "scanned_paths": set(),
+                }
                 self._scan_directory(
                     dir_path,
                     exclude_patterns,
@@ -90,19 +120,37 @@ class FileScanner:
                     calculate_hashes,
                     hash_strategy,
                     max_hash_size,
-                    stats,
+                    local_stats,
                 )
 
-                stats["directories_scanned"] += 1
+                with stats_lock:
+                    for key in (
+                        "files_scanned",
+                        "files_added",
+                        "files_updated",
+                        "errors",
+                    ):
+                        stats[key] += local_stats[key]
+                    stats["scanned_paths"] |= local_stats["scanned_paths"]
+                    stats["directories_scanned"] += 1
+                    scanned = stats["files_scanned"]
 
                 # Update progress
                 if self._progress_callback:
                     self._progress_callback(
-                        stats["files_scanned"],
+                        scanned,
                         0,  # Total unknown during scan
-                        f"Scanned {stats['files_scanned']} files",
+                        f"Scanned {scanned} files",
                     )
 
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(directories) or 1),
+                thread_name_prefix="isearch-scan",
+            ) as pool:
+                futures = [pool.submit(scan_root, d) for d in directories]
+                for future in futures:
+                    future.result()
+
             # Remove missing files if scan completed
             if not self._should_stop:
                 removed = self.db_manager.remove_missing_files(stats["scanned_paths"])
@@ -122,12 +170,12 @@ class FileScanner:
 
             self.db_manager.finish_scan_session(session_id, stats["files_removed"])
 
-            self.logger.info(f"Scan completed: {stats}")
+            self.logger.info("Scan completed: %s", stats)
             return stats
 
         except Exception as e:
             error_msg = str(e)
-            self.logger.error(f"Scan failed: {error_msg}")
+            self.logger.error("Scan failed: %s", error_msg)
             self.db_manager.finish_scan_session(session_id, error_message=error_msg)
             stats["error"] = error_msg
             return stats
@@ -143,50 +191,62 @@ class FileScanner:
         max_hash_size: int,
         stats: Dict[str, Any],
     ) -> None:
-        """Recursively scan a directory."""
+        """Recursively scan a directory.
 
-        try:
-            for item in directory.iterdir():
-                if self._should_stop:
-                    break
+        Uses os.scandir so the file-vs-directory checks come from the
+        directory entry itself, and passes the entry's cached stat
+        result into _process_file instead of stat-ing each file twice.
+        """
 
-                # Skip hidden files/directories if not requested
-                if not scan_hidden and item.name.startswith("."):
-                    continue
-
-                # Check exclude patterns
-                if self._should_exclude(item, exclude_patterns):
-                    continue
-
-                try:
-                    if item.is_file():
-                        self._process_file(
-                            item, calculate_hashes, hash_strategy, max_hash_size, stats
-                        )
-                    elif item.is_dir():
-                        # Handle symlinks
-                        if item.is_symlink() and not follow_symlinks:
-                            continue
-
-                        # Recursively scan subdirectory
-                        self._scan_directory(
-                            item,
-                            exclude_patterns,
-                            follow_symlinks,
-                            scan_hidden,
-                            calculate_hashes,
-                            hash_strategy,
-                            max_hash_size,
-                            stats,
-                        )
-
-                except (OSError, PermissionError) as e:
-                    self.logger.debug(f"Cannot access {item}: {e}")
-                    stats["errors"] += 1
-                    continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if self._should_stop:
+                        break
+
+                    # Skip hidden files/directories if not requested
+                    if not scan_hidden and entry.name.startswith("."):
+                        continue
+
+                    # Check exclude patterns
+                    if self._should_exclude(entry.name, entry.path):
+                        continue
+
+                    try:
+                        if entry.is_file():
+                            self._process_file(
+                                Path(entry.path),
+                                calculate_hashes,
+                                hash_strategy,
+                                max_hash_size,
+                                stats,
+                                file_stat=entry.stat(),
+                                is_symlink=entry.is_symlink(),
+                            )
+                        elif entry.is_dir():
+                            # Handle symlinks
+                            if entry.is_symlink() and not follow_symlinks:
+                                continue
+
+                            # Recursively scan subdirectory
+                            self._scan_directory(
+                                Path(entry.path),
+                                exclude_patterns,
+                                follow_symlinks,
+                                scan_hidden,
+                                calculate_hashes,
+                                hash_strategy,
+                                max_hash_size,
+                                stats,
+                            )
+
+                    except (OSError, PermissionError) as e:
+                        self.logger.debug("Cannot access %s: %s", entry.path, e)
+                        stats["errors"] += 1
+                        continue
 
         except (OSError, PermissionError) as e:
-            self.logger.warning(f"Cannot scan directory {directory}: {e}")
+            self.logger.warning("Cannot scan directory %s: %s", directory, e)
             stats["errors"] += 1
 
     def _process_file(
@@ -196,73 +256,84 @@ class FileScanner:
         hash_strategy: str,
         max_hash_size: int,
         stats: Dict[str, Any],
+        file_stat: Optional[os.stat_result] = None,
+        is_symlink: Optional[bool] = None,
     ) -> None:
-        """Process a single file."""
+        """Process a single file.
+
+        file_stat and is_symlink accept values the scandir walk already
+        has, so the common path issues no extra stat/lstat syscalls.
+        """
         try:
-            # Get file stats
-            file_stat = file_path.stat()
+            # Get file stats unless the caller already has them
+            if file_stat is None:
+                file_stat = file_path.stat()
+            if is_symlink is None:
+                is_symlink = file_path.is_symlink()
 
             # Skip if file is too large (configurable limit)
             max_size = 10 * 1024 * 1024 * 1024  # 10GB default
             if file_stat.st_size > max_size:
-                self.logger.debug(f"Skipping large file: {file_path}")
+                self.logger.debug("Skipping large file: %s", file_path)
                 return
 
-            # Prepare file info
-            file_info = {
-                "path": str(file_path),
-                "filename": file_path.name,
-                "directory": str(file_path.parent),
-                "size": file_stat.st_size,
-                "modified_date": file_stat.st_mtime,
-                "created_date": getattr(file_stat, "st_birthtime", file_stat.st_ctime),
-                "file_type": get_file_type(file_path.suffix),
-                "extension": file_path.suffix.lower(),
-                "is_hidden": file_path.name.startswith("."),
-                "is_symlink": file_path.is_symlink(),
-            }
-
-            # Calculate hash if requested and appropriate
-            if calculate_hashes and self._should_calculate_hash(
-                file_path, file_stat.st_size, hash_strategy, max_hash_size
-            ):
-                file_info["hash"] = self._calculate_file_hash(file_path, max_hash_size)
-
-            # Check if file already exists in database
+            # Check if file already exists in database; the lookup
+            # happens before any hashing so unchanged files on a rescan
+            # never get re-read and re-digested
             existing = self.db_manager.get_file_by_path(str(file_path))
 
-            if existing is None:
-                # New file
-                self.db_manager.add_file(file_info)
-                stats["files_added"] += 1
-            elif (
+            changed = existing is None or (
                 existing["modified_date"] != file_stat.st_mtime
                 or existing["size"] != file_stat.st_size
-            ):
-                # File was modified
+            )
+
+            if changed:
+                # Prepare file info
+                file_info = {
+                    "path": str(file_path),
+                    "filename": file_path.name,
+                    "directory": str(file_path.parent),
+                    "size": file_stat.st_size,
+                    "modified_date": file_stat.st_mtime,
+                    "created_date": getattr(
+                        file_stat, "st_birthtime", file_stat.st_ctime
+                    ),
+                    "file_type": get_file_type(file_path.suffix),
+                    "extension": file_path.suffix.lower(),
+                    "is_hidden": file_path.name.startswith("."),
+                    "is_symlink": is_symlink,
+                }
+
+                # Calculate hash if requested and appropriate
+                if calculate_hashes and self._should_calculate_hash(
+                    file_path, file_stat.st_size, hash_strategy, max_hash_size
+                ):
+                    file_info["hash"] = self._calculate_file_hash(
+                        file_path, max_hash_size, file_stat.st_size
+                    )
+
                 self.db_manager.add_file(file_info)
-                stats["files_updated"] += 1
+                if existing is None:
+                    stats["files_added"] += 1
+                else:
+                    stats["files_updated"] += 1
 
             # Track scanned paths for cleanup
             stats["scanned_paths"].add(str(file_path))
             stats["files_scanned"] += 1
 
         except (OSError, PermissionError) as e:
-            self.logger.debug(f"Cannot process file {file_path}: {e}")
+            self.logger.debug("Cannot process file %s: %s", file_path, e)
             stats["errors"] += 1
 
-    def _should_exclude(self, path: Path, exclude_patterns: List[str]) -> bool:
-        """Check if path should be excluded based on patterns."""
-        path_str = str(path)
-
-        for pattern in exclude_patterns:
-            # Support both filename and full path matching
-            if fnmatch.fnmatch(path.name, pattern) or fnmatch.fnmatch(
-                path_str, pattern
-            ):
-                return True
+    def _should_exclude(self, name: str, path_str: str) -> bool:
+        """Check if a path should be excluded by the compiled patterns."""
+        exclude_re = self._exclude_re
+        if exclude_re is None:
+            return False
 
-        return False
+        # Support both filename and full path matching
+        return bool(exclude_re.match(name) or exclude_re.match(path_str))
 
     def _should_calculate_hash(
         self, file_path: Path, file_size: int, strategy: str, max_size: int
@@ -360,14 +431,21 @@ class FileScanner:
         return file_size < 100 * 1024  # Files < 100KB
 
     def _calculate_file_hash(
-        self, file_path: Path, max_size: Optional[int] = None
-    ) -> Optional[str]:
-        """Calculate SHA-256 hash of file content using unified utility."""
+        self,
+        file_path: Path,
+        max_size: Optional[int] = None,
+        file_size: Optional[int] = None,
+    ) -> Optional[bytes]:
+        """Calculate SHA-256 hash of file content using unified utility.
+
+        file_size forwards the size the scan walk already has, so
+        hashing adds no stat syscall of its own.
+        """
         # Use provided max_size or default to 100MB for FileScanner
         if max_size is None:
             max_size = 100 * 1024 * 1024  # 100MB
 
-        return calculate_file_hash(str(file_path), max_size)
+        return calculate_file_hash(str(file_path), max_size, file_size)
 
     def quick_scan_directory(self, directory: Path) -> Dict[str, Any]:
         """Perform a quick scan to count files (for progress estimation)."""
@@ -1,11 +1,25 @@
 """Advanced search functionality for file database."""
 
+import functools
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from collections import Counter
 from dataclasses import dataclass
 
 from isearch.core.database import DatabaseManager
+from isearch.utils.file_utils import trigram_similarity
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str, flags: int) -> Pattern[str]:
+    """Compile a search regex once per (pattern, flags) pair.
+
+    Validation and post-filtering both need the compiled form, and
+    debounced incremental search repeats the same pattern many times.
+    """
+    return re.compile(pattern, flags)
 
 
 @dataclass
@@ -28,9 +42,15 @@ class SearchFilters:
 class SearchEngine:
     """Advanced search engine for file database."""
 
+    # Suggestion cache bounds: entries expire after a minute, and the
+    # cache is dropped wholesale if it somehow grows past the cap
+    _SUGGESTION_TTL = 60.0
+    _SUGGESTION_CACHE_MAX = 1024
+
     def __init__(self, db_manager: DatabaseManager) -> None:
         self.db_manager = db_manager
         self.logger = logging.getLogger(__name__)
+        self._suggestion_cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
 
     def search(self, filters: SearchFilters) -> List[Dict[str, Any]]:
         """
@@ -43,12 +63,18 @@ class SearchEngine:
             List of file records matching the criteria
         """
         try:
-            # Validate regex pattern if using regex
+            # Validate regex pattern if using regex; the compiled object
+            # is cached and reused by _post_filter_results
             if filters.use_regex and filters.query:
                 try:
-                    re.compile(filters.query)
+                    _compile_pattern(
+                        filters.query,
+                        0 if filters.case_sensitive else re.IGNORECASE,
+                    )
                 except re.error as e:
-                    self.logger.error(f"Invalid regex pattern: {filters.query} - {e}")
+                    self.logger.error(
+                        "Invalid regex pattern: %s - %s", filters.query, e
+                    )
                     return []
 
             results = []
@@ -95,11 +121,11 @@ class SearchEngine:
             # Apply limit
             unique_results = unique_results[: filters.limit]
 
-            self.logger.info(f"Search returned {len(unique_results)} results")
+            self.logger.info("Search returned %s results", len(unique_results))
             return unique_results
 
         except Exception as e:
-            self.logger.error(f"Search failed: {e}")
+            self.logger.error("Search failed: %s", e)
             return []
 
     def _post_filter_results(
@@ -112,7 +138,7 @@ class SearchEngine:
         # Regex filtering (more precise than DB LIKE)
         if filters.query and filters.use_regex:
             try:
-                pattern = re.compile(
+                pattern = _compile_pattern(
                     filters.query, 0 if filters.case_sensitive else re.IGNORECASE
                 )
                 search_field = "path" if filters.search_path else "filename"
@@ -183,8 +209,10 @@ class SearchEngine:
     ) -> float:
         """Calculate similarity between two files."""
 
-        # Name similarity (simple edit distance)
-        name_similarity = self._string_similarity(name1.lower(), name2.lower())
+        # Name similarity over character trigrams, which preserve
+        # ordering and so separate versioned copies from unrelated
+        # names sharing the same characters
+        name_similarity = trigram_similarity(name1, name2)
 
         # Size similarity
         if size1 == size2:
@@ -200,12 +228,27 @@ class SearchEngine:
 
         return total_similarity
 
+    def clear_suggestion_cache(self) -> None:
+        """Drop cached suggestions, e.g. after a scan changes the corpus."""
+        self._suggestion_cache.clear()
+
     def get_search_suggestions(self, partial_query: str, limit: int = 10) -> List[str]:
-        """Get search suggestions based on partial query."""
+        """Get search suggestions based on partial query.
+
+        Results are cached per lowercased prefix with a short TTL;
+        interactive search re-asks for the same prefix on every
+        keystroke, and the corpus only changes when a scan runs.
+        """
 
         if len(partial_query) < 2:
             return []
 
+        cache_key = (partial_query.lower(), limit)
+        now = time.monotonic()
+        cached = self._suggestion_cache.get(cache_key)
+        if cached is not None and now - cached[0] < self._SUGGESTION_TTL:
+            return cached[1]
+
         # Get filenames that start with or contain the query
         files = self.db_manager.search_files(
             query=partial_query, limit=limit * 3  # Get more to filter
@@ -230,7 +273,12 @@ class SearchEngine:
                 ):
                     suggestions.add(word)
 
-        return sorted(list(suggestions))[:limit]
+        result = sorted(list(suggestions))[:limit]
+
+        if len(self._suggestion_cache) >= self._SUGGESTION_CACHE_MAX:
+            self._suggestion_cache.clear()
+        self._suggestion_cache[cache_key] = (now, result)
+        return result
 
     def search_duplicates(
         self, method: str = "size_name", min_file_size: int = 1024
@@ -263,20 +311,21 @@ class SearchEngine:
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Find duplicates by matching size and filename."""
 
-        groups: Dict[Any, List[Dict[str, Any]]] = {}
+        # Count keys first so lists are only built for actual groups
+        key_counts = Counter(
+            (file_record["size"], file_record["filename"]) for file_record in files
+        )
 
+        duplicates: Dict[str, List[Dict[str, Any]]] = {}
         for file_record in files:
-            key = (file_record["size"], file_record["filename"])
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(file_record)
-
-        # Filter to only groups with multiple files
-        duplicates = {
-            f"{size}_{filename}": file_list
-            for (size, filename), file_list in groups.items()
-            if len(file_list) > 1
-        }
+            size = file_record["size"]
+            filename = file_record["filename"]
+            if key_counts[(size, filename)] < 2:
+                continue
+            group_key = f"{size}_{filename}"
+            if group_key not in duplicates:
+                duplicates[group_key] = []
+            duplicates[group_key].append(file_record)
 
         return duplicates
 
@@ -295,9 +344,10 @@ class SearchEngine:
                 groups[hash_key] = []
             groups[hash_key].append(file_record)
 
-        # Filter to only groups with multiple files
+        # Filter to only groups with multiple files, keyed by hex for
+        # printable group names
         duplicates = {
-            hash_key: file_list
+            hash_key.hex() if isinstance(hash_key, bytes) else hash_key: file_list
             for hash_key, file_list in groups.items()
             if len(file_list) > 1
         }
@@ -325,9 +375,3 @@ class SearchEngine:
         }
 
         return duplicates
-
-    def _string_similarity(self, s1: str, s2: str) -> float:
-        """Calculate string similarity using Levenshtein distance."""
-        from isearch.utils.file_utils import string_similarity
-
-        return string_similarity(s1, s2)
@@ -0,0 +1,10 @@
+"""GTK user interface package for isearch.
+
+Pinning the GTK version here means it happens exactly once, when the
+package is first imported; the UI modules below just import from
+gi.repository without repeating the require_version check.
+"""
+
+import gi
+
+gi.require_version("Gtk", "4.0")
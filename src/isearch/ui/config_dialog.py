@@ -1,9 +1,6 @@
 """Configuration dialog for directory management."""
 
 import logging
-import gi
-
-gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk  # noqa: E402
 
 from isearch.utils.config_manager import ConfigManager  # noqa: E402
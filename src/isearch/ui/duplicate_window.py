@@ -1,17 +1,38 @@
 """Duplicate file management window."""
 
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import re
+from typing import Dict, List, Any, Optional, Tuple
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
-import gi
-
-gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib, Pango  # noqa: E402
 
 from isearch.core.duplicate_detector import DuplicateDetector  # noqa: E402
 from isearch.core.database import DatabaseManager  # noqa: E402
 from isearch.core.file_scanner import FileScanner  # noqa: E402
+from isearch.ui.launcher import launch_default  # noqa: E402
+from isearch.utils.file_utils import format_size, format_timestamp  # noqa: E402
+
+# Fictional locations used by demo/test data, compiled once into a single
+# alternation so the check is one regex scan instead of a Python loop
+_TEST_DATA_INDICATORS_RE = re.compile(
+    "|".join(
+        re.escape(indicator)
+        for indicator in (
+            "/backup/",
+            "/downloads/",
+            "/documents/",
+            "/tmp/test",
+            "/photos/",
+            "vacation_beach.jpg",
+            "meeting_notes.txt",
+            "unique_photo.jpg",
+        )
+    )
+)
+_TEST_DATA_PREFIXES = ("/test/", "/demo/", "/sample/")
 
 
 class DuplicateWindow(Gtk.Window):
@@ -31,7 +52,13 @@ class DuplicateWindow(Gtk.Window):
 
         # Data
         self.duplicate_groups: Dict[str, List[Dict[str, Any]]] = {}
-        self.selected_for_deletion: set = set()
+        # Row-indexed selection bitmap; _row_paths gives display order and
+        # _row_index maps path -> row so toggles never hash long paths
+        self._selected_bits: bytearray = bytearray()
+        self._row_paths: List[str] = []
+        self._row_index: Dict[str, int] = {}
+        self._group_iters: Dict[str, Gtk.TreeIter] = {}
+        self._file_iters: Dict[str, Gtk.TreeIter] = {}
 
         # UI components
         self.groups_store: Optional[Gtk.ListStore] = None
@@ -49,6 +76,13 @@ class DuplicateWindow(Gtk.Window):
 
         # Operation state
         self._operation_running = False
+        self._delete_button_update_id = 0
+        self._last_delete_count = -1
+        self._groups_fill_id = 0
+        self._groups_fill_queue: List[Tuple[str, List[Dict[str, Any]]]] = []
+        self._groups_fill_model: Optional[Gtk.TreeModel] = None
+        self._groups_fill_sort: Tuple[bool, int, Any] = (False, 0, None)
+        self._pending_group_selection: Optional[str] = None
         self._current_method = "size_name"  # Default method
         self._queued_method: Optional[str] = None
         self._queued_selection: Optional[str] = None
@@ -568,12 +602,10 @@ class DuplicateWindow(Gtk.Window):
         if self.progress_bar:
             self.progress_bar.set_visible(False)
 
+        # Selection restore happens once the chunked fill finishes
+        self._pending_group_selection = preserve_selection
         self._populate_groups_list()
 
-        # Restore selection if requested
-        if preserve_selection:
-            self._restore_group_selection(preserve_selection)
-
         total_groups = len(duplicates)
         total_files = sum(len(files) for files in duplicates.values())
 
@@ -658,16 +690,60 @@ class DuplicateWindow(Gtk.Window):
                     lambda: self._load_duplicates(preserve_selection=queued_selection),
                 )
 
-        self.logger.error(f"Failed to load duplicates: {error}")
+        self.logger.error("Failed to load duplicates: %s", error)
+
+    # Rows inserted per idle callback while repopulating the groups list
+    _GROUPS_CHUNK_SIZE = 500
 
     def _populate_groups_list(self) -> None:
-        """Populate the groups list."""
+        """Repopulate the groups list in idle-sized chunks.
+
+        Filling thousands of rows inside the callback that delivered the
+        results would block the main loop for the whole rebuild; batched
+        idle steps let GTK keep dispatching events in between.
+        """
         if not self.groups_store:
             return
 
+        if self._groups_fill_id:
+            # A fill is already in flight: cancel it but keep the model and
+            # sort settings it captured, since the tree is still detached
+            GLib.source_remove(self._groups_fill_id)
+            self._groups_fill_id = 0
+        else:
+            # Detach the model and disable sorting while repopulating; with
+            # a sort column active every insert triggers an O(log n) re-sort
+            self._groups_fill_model = (
+                self.groups_tree.get_model() if self.groups_tree else None
+            )
+            if self.groups_tree:
+                self.groups_tree.set_model(None)
+            sort = self.groups_store.get_sort_column_id()
+            self._groups_fill_sort = (sort[0], sort[1], sort[2])
+            if sort[0]:
+                # -2 == GTK_TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID
+                self.groups_store.set_sort_column_id(-2, sort[2])
+
         self.groups_store.clear()
+        self._group_iters.clear()
+
+        # Reverse order so each batch prepends at position 0: appending
+        # makes GTK walk to the list tail, which is accidentally O(n^2)
+        self._groups_fill_queue = list(reversed(self.duplicate_groups.items()))
+        self._groups_fill_id = GLib.idle_add(
+            self._fill_groups_step, priority=GLib.PRIORITY_DEFAULT_IDLE
+        )
+
+    def _fill_groups_step(self) -> bool:
+        """Insert one batch of group rows; reschedules itself until done."""
+        if not self.groups_store:
+            self._groups_fill_id = 0
+            return False
 
-        for group_name, files in self.duplicate_groups.items():
+        batch = self._groups_fill_queue[: self._GROUPS_CHUNK_SIZE]
+        del self._groups_fill_queue[: self._GROUPS_CHUNK_SIZE]
+
+        for group_name, files in batch:
             total_size = sum(f["size"] for f in files)
             file_count = len(files)
 
@@ -678,7 +754,35 @@ class DuplicateWindow(Gtk.Window):
             size_str = self._format_size(total_size)
             savings_str = self._format_size(potential_savings)
 
-            self.groups_store.append([group_name, size_str, file_count, savings_str])
+            # Single call sets every column at once, halving the GObject
+            # round-trips compared to append + per-column set_value
+            # (ListStore iters stay valid, so they can be indexed for
+            # O(1) selection restore)
+            self._group_iters[group_name] = self.groups_store.insert_with_values(
+                0, (0, 1, 2, 3), (group_name, size_str, file_count, savings_str)
+            )
+
+        if self._groups_fill_queue:
+            return True  # More batches pending; run again on next idle
+
+        self._finish_groups_fill()
+        return False
+
+    def _finish_groups_fill(self) -> None:
+        """Reattach the model and restore sort/selection after a fill."""
+        self._groups_fill_id = 0
+
+        sorted_before, sort_col, sort_order = self._groups_fill_sort
+        if sorted_before and self.groups_store:
+            self.groups_store.set_sort_column_id(sort_col, sort_order)
+        if self.groups_tree:
+            self.groups_tree.set_model(self._groups_fill_model)
+        self._groups_fill_model = None
+
+        if self._pending_group_selection:
+            selection = self._pending_group_selection
+            self._pending_group_selection = None
+            self._restore_group_selection(selection)
 
     def _on_group_selected(self, selection: Gtk.TreeSelection) -> None:
         """Handle group selection."""
@@ -699,27 +803,51 @@ class DuplicateWindow(Gtk.Window):
         if not self.files_store:
             return
 
-        self.files_store.clear()
+        # Same batching as the groups list: detach the model and suspend
+        # sorting so the rebuild doesn't re-sort per insert
+        model = self.files_tree.get_model() if self.files_tree else None
+        if self.files_tree:
+            self.files_tree.set_model(None)
+        sorted_before, sort_col, sort_order = self.files_store.get_sort_column_id()
+        if sorted_before:
+            self.files_store.set_sort_column_id(-2, sort_order)
 
-        # Clear any previous selections from other groups
-        self.selected_for_deletion.clear()
+        try:
+            self._fill_files_store(files)
+        finally:
+            if sorted_before:
+                self.files_store.set_sort_column_id(sort_col, sort_order)
+            if self.files_tree:
+                self.files_tree.set_model(model)
+
+    def _fill_files_store(self, files: List[Dict[str, Any]]) -> None:
+        """Rebuild the (detached) files store for the selected group."""
+        if not self.files_store:
+            return
+
+        self.files_store.clear()
 
         # Get recommendations for this group
         analysis = self.duplicate_detector.analyze_duplicate_group(files)
         keep_file_path = analysis.get("keep_file", {}).get("path", "")
 
-        print(f"   📋 Populating files list for group, keep_file: {keep_file_path}")
+        self.logger.debug("Populating files list, keep_file: %s", keep_file_path)
 
-        for file_record in files:
+        # Reverse insertion order and prepend so GTK never walks to the
+        # list tail (append is O(n) per row); final order is unchanged
+        inserted_iters = []
+        for file_record in reversed(files):
             is_recommended_for_deletion = file_record["path"] != keep_file_path
             size_str = self._format_size(file_record["size"])
             modified_str = self._format_date(file_record["modified_date"])
 
             recommendation = "DELETE" if is_recommended_for_deletion else "KEEP"
 
-            # Add to the visual list
-            self.files_store.append(
-                [
+            # Add to the visual list (bulk insert sets all columns in one call)
+            row_iter = self.files_store.insert_with_values(
+                0,
+                (0, 1, 2, 3, 4, 5, 6),
+                (
                     is_recommended_for_deletion,  # Default selection (checkbox state)
                     file_record["filename"],
                     size_str,
@@ -727,18 +855,26 @@ class DuplicateWindow(Gtk.Window):
                     file_record["directory"],
                     recommendation,
                     file_record["path"],
-                ]
+                ),
+            )
+            inserted_iters.append(
+                (file_record["path"], row_iter, is_recommended_for_deletion)
             )
 
-            # Update selected_for_deletion set for auto-selected files
-            if is_recommended_for_deletion:
-                self.selected_for_deletion.add(file_record["path"])
-                print(f"   ✅ Auto-selected for deletion: {file_record['filename']}")
+        # Index rows by path in display order for O(1) lookups later, and
+        # rebuild the selection bitmap (auto-selected files start checked)
+        inserted_iters.reverse()
+        self._file_iters = {path: it for path, it, _ in inserted_iters}
+        self._row_paths = [path for path, _, _ in inserted_iters]
+        self._row_index = {path: i for i, path in enumerate(self._row_paths)}
+        self._selected_bits = bytearray(
+            int(selected) for _, _, selected in inserted_iters
+        )
 
         # Update the delete button state based on actual selections
         self._update_delete_button()
-        print(
-            f"   📊 Total files selected for deletion: {len(self.selected_for_deletion)}"
+        self.logger.debug(
+            "Total files selected for deletion: %d", sum(self._selected_bits)
         )
 
     def _on_file_toggled(self, renderer: Gtk.CellRendererToggle, path: str) -> None:
@@ -754,31 +890,50 @@ class DuplicateWindow(Gtk.Window):
 
         file_path = self.files_store.get_value(iter, 6)
 
-        if new_value:
-            self.selected_for_deletion.add(file_path)
-        else:
-            self.selected_for_deletion.discard(file_path)
+        row_index = self._row_index.get(file_path)
+        if row_index is not None:
+            self._selected_bits[row_index] = int(new_value)
 
         self._update_delete_button()
 
     def _update_delete_button(self) -> None:
+        """Schedule a delete button refresh on the next main-loop idle.
+
+        Toggling many checkboxes (auto-select, clear) requests an update
+        per row; coalescing into one idle callback updates the button once.
+        """
+        if self._delete_button_update_id:
+            return
+        self._delete_button_update_id = GLib.idle_add(self._do_update_delete_button)
+
+    def _do_update_delete_button(self) -> bool:
         """Update delete button state."""
+        self._delete_button_update_id = 0
         if self.delete_button:
-            has_selection = len(self.selected_for_deletion) > 0
-            print(
-                f"   🗑️  Updating delete button: "
-                f"{len(self.selected_for_deletion)} selected, enabled={has_selection}"
+            count = sum(self._selected_bits)
+            if count == self._last_delete_count:
+                return False  # Nothing changed; skip the property writes
+
+            has_selection = count > 0
+            self.logger.debug(
+                "Updating delete button: %d selected, enabled=%s",
+                count,
+                has_selection,
             )
 
-            self.delete_button.set_sensitive(has_selection)
+            # Each property write emits notify:: and recomputes style, so
+            # only touch sensitivity when crossing the 0 <-> non-zero edge
+            if has_selection != (self._last_delete_count > 0):
+                self.delete_button.set_sensitive(has_selection)
 
             if has_selection:
-                label = f"Delete {len(self.selected_for_deletion)} Files"
-                self.delete_button.set_label(label)
-                print(f"   📝 Delete button label: '{label}'")
+                self.delete_button.set_label(f"Delete {count} Files")
             else:
                 self.delete_button.set_label("Delete Selected")
-                print("   📝 Delete button label: 'Delete Selected' (disabled)")
+
+            self._last_delete_count = count
+
+        return False  # One-shot idle callback
 
     # Event handlers
     def _on_refresh_clicked(self, button: Gtk.Button) -> None:
@@ -878,21 +1033,30 @@ class DuplicateWindow(Gtk.Window):
         if not self.files_store:
             return
 
-        self.selected_for_deletion.clear()
-
-        # Select all files marked for deletion
-        iter = self.files_store.get_iter_first()
-        while iter:
-            recommendation = self.files_store.get_value(iter, 5)
-            should_select = recommendation == "DELETE"
-
-            self.files_store.set_value(iter, 0, should_select)
+        self._selected_bits = bytearray(len(self._row_paths))
 
-            if should_select:
-                file_path = self.files_store.get_value(iter, 6)
-                self.selected_for_deletion.add(file_path)
+        # Detach the model while updating so GTK doesn't re-render and
+        # re-sort the view after every row write
+        model = self.files_tree.get_model() if self.files_tree else None
+        if self.files_tree:
+            self.files_tree.set_model(None)
 
-            iter = self.files_store.iter_next(iter)
+        try:
+            # ListStore iters stay valid, so walk the cached ones instead
+            # of iter_next round-trips; only write the checkbox column when
+            # it actually changes to avoid redundant FFI calls
+            for row_index, row_iter in enumerate(self._file_iters.values()):
+                recommendation = self.files_store.get_value(row_iter, 5)
+                should_select = recommendation == "DELETE"
+
+                if self.files_store.get_value(row_iter, 0) != should_select:
+                    self.files_store.set_value(row_iter, 0, should_select)
+
+                if should_select:
+                    self._selected_bits[row_index] = 1
+        finally:
+            if self.files_tree:
+                self.files_tree.set_model(model)
 
         self._update_delete_button()
 
@@ -901,18 +1065,26 @@ class DuplicateWindow(Gtk.Window):
         if not self.files_store:
             return
 
-        self.selected_for_deletion.clear()
+        self._selected_bits = bytearray(len(self._row_paths))
+
+        # Detach the model while updating (same batching as auto-select)
+        model = self.files_tree.get_model() if self.files_tree else None
+        if self.files_tree:
+            self.files_tree.set_model(None)
 
-        iter = self.files_store.get_iter_first()
-        while iter:
-            self.files_store.set_value(iter, 0, False)
-            iter = self.files_store.iter_next(iter)
+        try:
+            for row_iter in self._file_iters.values():
+                if self.files_store.get_value(row_iter, 0):
+                    self.files_store.set_value(row_iter, 0, False)
+        finally:
+            if self.files_tree:
+                self.files_tree.set_model(model)
 
         self._update_delete_button()
 
     def _on_delete_clicked(self, button: Gtk.Button) -> None:
         """Handle delete button click."""
-        if not self.selected_for_deletion:
+        if not any(self._selected_bits):
             return
 
         # Show confirmation dialog
@@ -945,7 +1117,7 @@ class DuplicateWindow(Gtk.Window):
     def _get_selected_file_path(self) -> Optional[str]:
         """Get path of currently selected file."""
         if not self.files_tree or not self.files_store:
-            print("   📋 No files tree or store available")
+            self.logger.debug("No files tree or store available")
             return None
 
         # First, try to get the TreeView row selection
@@ -954,193 +1126,106 @@ class DuplicateWindow(Gtk.Window):
             model, iter = selection.get_selected()
             if iter:
                 file_path = model.get_value(iter, 6)  # Path column
-                print(f"   📋 Selected file path (from row selection): '{file_path}'")
+                self.logger.debug("Selected file path (row selection): %r", file_path)
                 return file_path
 
-        print("   📋 No row selected in tree view, checking for checked files...")
+        self.logger.debug("No row selected in tree view, checking checked files")
 
         # If no row is selected, try to find a checked file (checkbox selection)
-        # This handles the case where user checked a box but didn't select the row
-        iter = self.files_store.get_iter_first()
-        checked_files = []
-
-        while iter:
-            is_checked = self.files_store.get_value(iter, 0)  # Checkbox column
-            if is_checked:
-                file_path = self.files_store.get_value(iter, 6)  # Path column
-                checked_files.append(file_path)
-                print(f"   📋 Found checked file: '{file_path}'")
-            iter = self.files_store.iter_next(iter)
+        # This handles the case where user checked a box but didn't select the
+        # row. The selection bitmap mirrors the checkbox column and
+        # _row_paths preserves display order, so no store scan is needed.
+        checked_files = [
+            path for path, bit in zip(self._row_paths, self._selected_bits) if bit
+        ]
 
         if len(checked_files) == 1:
             # If exactly one file is checked, use that
-            print(f"   📋 Using single checked file: '{checked_files[0]}'")
+            self.logger.debug("Using single checked file: %r", checked_files[0])
             return checked_files[0]
         elif len(checked_files) > 1:
             # If multiple files are checked, use the first one but warn user
-            print(
-                f"   ⚠️  Multiple files checked ({len(checked_files)}), "
-                f"using first: '{checked_files[0]}'"
+            self.logger.debug(
+                "Multiple files checked (%d), using first: %r",
+                len(checked_files),
+                checked_files[0],
             )
             return checked_files[0]
 
         # If no files are checked either, try to get the first file in the list
-        if self.files_store:
-            iter = self.files_store.get_iter_first()
-            if iter:
-                file_path = self.files_store.get_value(iter, 6)
-                print(f"   📋 No selection found, using first file: '{file_path}'")
-                return file_path
-            else:
-                print("   📋 Files store exists but is empty")
+        first_path = self._row_paths[0] if self._row_paths else None
+        if first_path is not None:
+            self.logger.debug("No selection found, using first file: %r", first_path)
+            return first_path
         else:
-            print("   📋 No files store available")
+            self.logger.debug("Files store exists but is empty")
 
-        print("   📋 No files available in the list")
+        self.logger.debug("No files available in the list")
         return None
 
     def _open_file(self, file_path: str) -> None:
         """Open file with default application."""
-        print(f"   🔍 Attempting to open file: {file_path}")
+        self.logger.debug("Attempting to open file: %s", file_path)
 
         try:
-            import subprocess
-            import os
-
-            if os.path.exists(file_path):
-                print("   ✅ File exists, attempting to open")
-
-                # Try multiple methods to open the file
-                open_commands = ["xdg-open", "open", "start"]
-                success = False
-
-                for cmd in open_commands:
-                    try:
-                        result = subprocess.run(
-                            [cmd, file_path],
-                            capture_output=True,
-                            text=True,
-                            check=False,
-                        )
-                        if result.returncode == 0:
-                            print(f"   ✅ Successfully opened file with {cmd}")
-                            if self.status_label:
-                                self.status_label.set_text(
-                                    f"Opened: {os.path.basename(file_path)}"
-                                )
-                            success = True
-                            break
-                        else:
-                            print(f"   ⚠️  {cmd} failed: {result.stderr}")
-                    except FileNotFoundError:
-                        print(f"   ⚠️  {cmd} not found")
-                        continue
-
-                if not success:
-                    print("   ❌ No suitable file opener found")
-                    message = (
-                        f"File opener not available - file exists: "
-                        f"{os.path.basename(file_path)}"
-                    )
-                    if self.status_label:
-                        self.status_label.set_text(message)
-            else:
-                print("   ❌ File does not exist")
+            if not os.path.exists(file_path):
                 message = f"File not found: {file_path}"
-                print(f"   ⚠️  {message}")
+                if self.status_label:
+                    self.status_label.set_text(message)
+                return
+
+            if launch_default(file_path):
+                if self.status_label:
+                    self.status_label.set_text(f"Opened: {os.path.basename(file_path)}")
+            else:
+                message = (
+                    f"File opener not available - file exists: "
+                    f"{os.path.basename(file_path)}"
+                )
                 if self.status_label:
                     self.status_label.set_text(message)
 
         except Exception as e:
-            print(f"   ❌ Exception opening file: {e}")
             if self.status_label:
                 self.status_label.set_text(f"Failed to open file: {e}")
-            self.logger.error(f"Failed to open file: {e}")
+            self.logger.error("Failed to open file: %s", e)
 
     def _is_test_data_path(self, file_path: str) -> bool:
         """Check if this is a test data path that doesn't actually exist."""
         if not file_path:
             return False
 
-        test_indicators = [
-            "/backup/",
-            "/downloads/",
-            "/documents/",
-            "/tmp/test",
-            "/photos/",
-            "/backup/documents/",
-            "/backup/vacation",
-            "vacation_beach.jpg",
-            "meeting_notes.txt",
-            "unique_photo.jpg",
-        ]
-
-        is_test = any(indicator in file_path for indicator in test_indicators)
+        is_test = bool(
+            _TEST_DATA_INDICATORS_RE.search(file_path)
+        ) or file_path.startswith(_TEST_DATA_PREFIXES)
 
-        # Also check if path starts with common test prefixes
-        test_prefixes = ["/test/", "/demo/", "/sample/"]
-        is_test = is_test or any(
-            file_path.startswith(prefix) for prefix in test_prefixes
-        )
-
-        print(f"   🔍 Test data check: '{file_path}' -> {is_test}")
+        self.logger.debug("Test data check: %r -> %s", file_path, is_test)
         return is_test
 
     def _reveal_file(self, file_path: str) -> None:
         """Reveal file in file manager."""
-        print(f"   📁 Attempting to reveal file: {file_path}")
+        self.logger.debug("Attempting to reveal file: %s", file_path)
 
         try:
-            import subprocess
-            import os
-
-            if os.path.exists(file_path):
-                directory = os.path.dirname(file_path)
-                print(f"   ✅ File exists, attempting to open directory: {directory}")
-
-                # Try multiple methods to open the directory
-                open_commands = ["xdg-open", "open", "start", "explorer"]
-                success = False
-
-                for cmd in open_commands:
-                    try:
-                        result = subprocess.run(
-                            [cmd, directory],
-                            capture_output=True,
-                            text=True,
-                            check=False,
-                        )
-                        if result.returncode == 0:
-                            print(f"   ✅ Successfully opened folder with {cmd}")
-                            if self.status_label:
-                                self.status_label.set_text(
-                                    f"Opened folder: {directory}"
-                                )
-                            success = True
-                            break
-                        else:
-                            print(f"   ⚠️  {cmd} failed: {result.stderr}")
-                    except FileNotFoundError:
-                        print(f"   ⚠️  {cmd} not found")
-                        continue
-
-                if not success:
-                    print("   ❌ No suitable folder opener found")
-                    message = f"File manager not available - folder exists: {directory}"
-                    if self.status_label:
-                        self.status_label.set_text(message)
-            else:
-                print("   ❌ File does not exist")
+            if not os.path.exists(file_path):
                 message = f"File not found: {file_path}"
-                print(f"   ⚠️  {message}")
+                if self.status_label:
+                    self.status_label.set_text(message)
+                return
+
+            directory = os.path.dirname(file_path)
+            if launch_default(directory):
+                if self.status_label:
+                    self.status_label.set_text(f"Opened folder: {directory}")
+            else:
+                message = f"File manager not available - folder exists: {directory}"
                 if self.status_label:
                     self.status_label.set_text(message)
 
         except Exception as e:
-            print(f"   ❌ Exception revealing file: {e}")
             if self.status_label:
                 self.status_label.set_text(f"Failed to open folder: {e}")
-            self.logger.error(f"Failed to reveal file: {e}")
+            self.logger.error("Failed to reveal file: %s", e)
 
     def _on_row_activated(
         self, tree_view: Gtk.TreeView, path: Gtk.TreePath, column: Gtk.TreeViewColumn
@@ -1211,7 +1296,7 @@ class DuplicateWindow(Gtk.Window):
 
     def _show_delete_confirmation(self) -> None:
         """Show deletion confirmation dialog."""
-        count = len(self.selected_for_deletion)
+        count = sum(self._selected_bits)
 
         dialog = Gtk.MessageDialog(
             transient_for=self,
@@ -1232,72 +1317,70 @@ class DuplicateWindow(Gtk.Window):
         dialog.show()
 
     def _perform_deletion(self) -> None:
-        """Perform actual file deletion."""
-        import os
-
+        """Perform file deletion in the background."""
         if self.status_label:
             self.status_label.set_text("Deleting files...")
 
-        deleted_count = 0
-        failed_count = 0
-        failed_files = []
-
-        for file_path in list(self.selected_for_deletion):
-            try:
-                print(f"🗑️  Deleting file: {file_path}")
-
-                # Check if file exists before attempting deletion
-                if not os.path.exists(file_path):
-                    print(f"   ⚠️  File not found: {file_path}")
-                    # Still try to remove from database in case it's orphaned
-                    self.db_manager.remove_file_by_path(file_path)
-                    failed_count += 1
-                    failed_files.append(f"{file_path} (not found)")
-                    continue
-
-                # Attempt to delete the file
-                os.remove(file_path)
-                print(f"   ✅ File deleted successfully: {file_path}")
-
-                # Remove from database
-                db_removed = self.db_manager.remove_file_by_path(file_path)
-                if db_removed:
-                    print(f"   ✅ Removed from database: {file_path}")
-                else:
-                    print(f"   ⚠️  File not found in database: {file_path}")
-
-                deleted_count += 1
-
-            except PermissionError as e:
-                error_msg = (
-                    f"Permission denied (readonly): {os.path.basename(file_path)}"
-                )
-                print(f"   🔒 {error_msg}")
-                self.logger.info(f"Failed to delete readonly file {file_path}: {e}")
-                failed_count += 1
-                failed_files.append(error_msg)
-
-            except OSError as e:
-                error_msg = f"OS error for {os.path.basename(file_path)}: {str(e)}"
-                print(f"   ❌ {error_msg}")
-                self.logger.error(f"OS error deleting {file_path}: {e}")
-                failed_count += 1
-                failed_files.append(error_msg)
+        paths = [path for path, bit in zip(self._row_paths, self._selected_bits) if bit]
+
+        # Run the whole deletion pipeline off the GTK main thread so the
+        # window stays responsive, mirroring the load/scan workers
+        def delete_worker() -> None:
+            deleted_count = 0
+            failed_count = 0
+            failed_files = []
+            db_removals = []
+
+            # Deletions are independent syscalls, so fan them out over a
+            # small worker pool instead of removing files one at a time
+            max_workers = min(8, max(1, len(paths)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for file_path, (error_msg, remove_from_db) in zip(
+                    paths, executor.map(self._delete_one_file, paths)
+                ):
+                    if remove_from_db:
+                        db_removals.append(file_path)
+                    if error_msg is None:
+                        deleted_count += 1
+                    else:
+                        failed_count += 1
+                        failed_files.append(error_msg)
+
+            # One bulk database transaction instead of a locked round-trip
+            # per deleted file
+            self.db_manager.remove_files_by_paths(db_removals)
+
+            GLib.idle_add(
+                self._on_deletion_completed,
+                deleted_count,
+                failed_count,
+                failed_files,
+            )
 
-            except Exception as e:
-                error_msg = (
-                    f"Unexpected error for {os.path.basename(file_path)}: {str(e)}"
-                )
-                print(f"   ❌ {error_msg}")
-                self.logger.error(f"Failed to delete {file_path}: {e}")
-                failed_count += 1
-                failed_files.append(error_msg)
+        threading.Thread(target=delete_worker, daemon=True).start()
 
+    def _on_deletion_completed(
+        self, deleted_count: int, failed_count: int, failed_files: List[str]
+    ) -> None:
+        """Handle deletion completion on the main thread."""
         # Clear selection
-        self.selected_for_deletion.clear()
-
-        # Refresh the view
-        self._load_duplicates()
+        self._selected_bits = bytearray(len(self._row_paths))
+
+        # Refresh the view; detach both models first so GTK doesn't run
+        # per-row layout invalidation while the stores are rebuilt
+        files_model = self.files_tree.get_model() if self.files_tree else None
+        groups_model = self.groups_tree.get_model() if self.groups_tree else None
+        if self.files_tree:
+            self.files_tree.set_model(None)
+        if self.groups_tree:
+            self.groups_tree.set_model(None)
+        try:
+            self._load_duplicates()
+        finally:
+            if self.files_tree:
+                self.files_tree.set_model(files_model)
+            if self.groups_tree:
+                self.groups_tree.set_model(groups_model)
 
         # Update status with results
         if self.status_label:
@@ -1320,20 +1403,53 @@ class DuplicateWindow(Gtk.Window):
 
             self.status_label.set_text(status_msg)
 
+    def _delete_one_file(self, file_path: str) -> Tuple[Optional[str], bool]:
+        """Delete one file from disk.
+
+        Returns (error_msg, remove_from_db): error_msg is None on success,
+        and remove_from_db is True when the database record should go away
+        (deleted, or orphaned because the file no longer exists).
+        """
+        # Computed once up front; every error path below reports it
+        basename = os.path.basename(file_path)
+
+        try:
+            self.logger.debug("Deleting file: %s", file_path)
+
+            # Check if file exists before attempting deletion
+            if not os.path.exists(file_path):
+                self.logger.debug("File not found: %s", file_path)
+                # Still remove from database in case it's orphaned
+                return f"{file_path} (not found)", True
+
+            # Attempt to delete the file
+            os.remove(file_path)
+            self.logger.debug("File deleted successfully: %s", file_path)
+
+            return None, True
+
+        except PermissionError as e:
+            error_msg = f"Permission denied (readonly): {basename}"
+            self.logger.info("Failed to delete readonly file %s: %s", file_path, e)
+            return error_msg, False
+
+        except OSError as e:
+            error_msg = f"OS error for {basename}: {str(e)}"
+            self.logger.error("OS error deleting %s: %s", file_path, e)
+            return error_msg, False
+
+        except Exception as e:
+            error_msg = f"Unexpected error for {basename}: {str(e)}"
+            self.logger.error("Failed to delete %s: %s", file_path, e)
+            return error_msg, False
+
     def _format_size(self, size_bytes: float) -> str:
         """Format file size in human readable format."""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        return format_size(size_bytes)
 
     def _format_date(self, timestamp: float) -> str:
         """Format timestamp as readable date."""
-        import datetime
-
-        dt = datetime.datetime.fromtimestamp(timestamp)
-        return dt.strftime("%Y-%m-%d %H:%M")
+        return format_timestamp(timestamp)
 
     def _get_selected_group_name(self) -> Optional[str]:
         """Get the currently selected group name."""
@@ -1364,22 +1480,20 @@ class DuplicateWindow(Gtk.Window):
         if not group_name or not self.groups_store:
             return
 
-        print(f"   🔍 Looking for group: {group_name}")
-        iter = self.groups_store.get_iter_first()
-        while iter:
-            if self.groups_store.get_value(iter, 0) == group_name and self.groups_tree:
-                selection = self.groups_tree.get_selection()
-                if selection:
-                    selection.select_iter(iter)
-                    print(f"   ✅ Restored selection to: {group_name}")
-                return
-            iter = self.groups_store.iter_next(iter)
+        self.logger.debug("Looking for group: %s", group_name)
+        iter = self._group_iters.get(group_name)
+        if iter is not None and self.groups_tree:
+            selection = self.groups_tree.get_selection()
+            if selection:
+                selection.select_iter(iter)
+                self.logger.debug("Restored selection to: %s", group_name)
+            return
 
-        print(f"   ⚠️  Group not found: {group_name}")
+        self.logger.debug("Group not found: %s", group_name)
 
     def _set_ui_enabled(self, enabled: bool) -> None:
         """Enable/disable UI controls during operations."""
-        print(f"   🎛️  UI controls {'enabled' if enabled else 'disabled'}")
+        self.logger.debug("UI controls %s", "enabled" if enabled else "disabled")
 
         # Don't disable method buttons - they should always be clickable
         # Method changes can be queued if operations are running
@@ -1402,5 +1516,9 @@ class DuplicateWindow(Gtk.Window):
             # When UI is disabled (during operations), disable action buttons
             if self.delete_button:
                 self.delete_button.set_sensitive(False)
+                # Direct sensitivity write bypasses the coalesced
+                # updater; invalidate its cache or the re-enable pass
+                # skips the write when the selection count is unchanged
+                self._last_delete_count = -1
             if self.auto_select_button:
                 self.auto_select_button.set_sensitive(False)
@@ -0,0 +1,42 @@
+"""Shared helper for opening files with the desktop's default handler."""
+
+import logging
+import os
+import shutil
+import subprocess
+
+from gi.repository import Gio, GLib
+
+logger = logging.getLogger(__name__)
+
+# Resolved once at import; per-call probing of openers that don't exist
+# would fork the interpreter for every failed attempt
+_FALLBACK_OPENER = (
+    shutil.which("xdg-open") or shutil.which("open") or shutil.which("start")
+)
+
+
+def launch_default(target: str) -> bool:
+    """
+    Open a file or folder with the desktop's default handler.
+
+    GIO resolves the handler in-process, so there is no fork of the
+    interpreter and no blocking wait on a child. Where no GIO handler is
+    configured, a detached opener process is spawned as a fallback.
+
+    Args:
+        target: Path to the file or directory to open
+
+    Returns:
+        True if a handler was launched
+    """
+    uri = GLib.filename_to_uri(os.path.abspath(target), None)
+    try:
+        return bool(Gio.AppInfo.launch_default_for_uri(uri, None))
+    except GLib.Error as e:
+        logger.debug("GIO launch failed for %s: %s", target, e)
+
+    if _FALLBACK_OPENER:
+        subprocess.Popen([_FALLBACK_OPENER, target], start_new_session=True)
+        return True
+    return False
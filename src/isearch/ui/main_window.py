@@ -1,28 +1,64 @@
 """Main application window for isearch."""
 
 import logging
+import os
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import Optional, Any, List, Dict
+from typing import Optional, Any, List, Dict, Tuple
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk, Gio, GLib  # noqa: E402
+from gi.repository import Gtk, Gdk, Gio, GLib  # noqa: E402
 
 
 from isearch.core.database import DatabaseManager  # noqa: E402
 from isearch.core.file_scanner import FileScanner  # noqa: E402
 from isearch.core.search_engine import SearchEngine, SearchFilters  # noqa: E402
 from isearch.ui.duplicate_window import DuplicateWindow  # noqa: E402
+from isearch.ui.launcher import launch_default  # noqa: E402
 from isearch.utils.config_manager import ConfigManager  # noqa: E402
+from isearch.utils.file_utils import format_size, format_timestamp  # noqa: E402
 from isearch.utils.constants import (  # noqa: E402
+    SEARCH_DEBOUNCE_MS,
+    TYPE_LABELS,
     WINDOW_DEFAULT_WIDTH,
     WINDOW_DEFAULT_HEIGHT,
     WINDOW_MIN_WIDTH,
     WINDOW_MIN_HEIGHT,
 )
 
+# Enum values resolved once at import; each in-method reference walks
+# pygobject's override machinery, which adds up in widget construction
+_HORIZONTAL = Gtk.Orientation.HORIZONTAL
+_VERTICAL = Gtk.Orientation.VERTICAL
+_ALIGN_START = Gtk.Align.START
+
+# Shared padding styles: one CSS class per container replaces four
+# per-widget margin property sets and their style invalidations
+_PANEL_CSS = b"""
+.pad-6 { margin: 6px; }
+.pad-sides-6 { margin-left: 6px; margin-right: 6px; }
+.pad-3-6 { margin: 3px 6px; }
+"""
+
+_css_installed = False
+
+
+def _install_panel_css() -> None:
+    """Register the shared style classes once per process."""
+    global _css_installed
+    if _css_installed:
+        return
+
+    display = Gdk.Display.get_default()
+    if display is not None:
+        provider = Gtk.CssProvider()
+        provider.load_from_data(_PANEL_CSS)
+        Gtk.StyleContext.add_provider_for_display(
+            display, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+    _css_installed = True
+
 
 class MainWindow(Gtk.ApplicationWindow):
     """Main application window."""
@@ -39,16 +75,40 @@ class MainWindow(Gtk.ApplicationWindow):
         self.file_scanner = FileScanner(self.db_manager)
         self.search_engine = SearchEngine(self.db_manager)
 
+        # Shared pool for short queries; spawning a fresh thread per
+        # search costs more than the query for a warm database
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="isearch-query"
+        )
+        self.connect("close-request", self._on_close_request)
+
         # UI state
         self._scanning = False
         self._scan_thread: Optional[threading.Thread] = None
+        self._search_debounce_id = 0
+        # Monotonic tag for the newest submitted search; lets stale
+        # result sets be dropped when the pool completes out of order
+        self._search_seq = 0
+        # Shadow copies of the filter checkboxes, updated on toggle, so
+        # building a query never crosses into GObject property reads
+        self._filter_state: Dict[str, bool] = dict.fromkeys(
+            ("regex", "fullpath", "images", "videos", "docs"), False
+        )
 
         # UI components
         self.search_entry: Optional[Gtk.Entry] = None
         self.results_label: Optional[Gtk.Label] = None
-        self.results_view: Optional[Gtk.TextView] = None
+        self.results_store: Optional[Gtk.ListStore] = None
+        self.results_tree: Optional[Gtk.TreeView] = None
+        self._content_slot: Optional[Gtk.Box] = None
+        self._empty_hint: Optional[Gtk.Label] = None
+        self._results_fill_id = 0
+        self._results_fill_queue: List[Tuple[str, str, str, str, str]] = []
+        self._results_fill_model: Optional[Gtk.TreeModel] = None
+        self._results_fill_sort: Tuple[bool, int, Any] = (False, 0, None)
         self.status_label: Optional[Gtk.Label] = None
         self.progress_bar: Optional[Gtk.ProgressBar] = None
+        self._progress_revealer: Optional[Gtk.Revealer] = None
         self.regex_check: Optional[Gtk.CheckButton] = None
         self.fullpath_check: Optional[Gtk.CheckButton] = None
         self.images_check: Optional[Gtk.CheckButton] = None
@@ -76,9 +136,12 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def _setup_ui(self) -> None:
         """Create the user interface."""
-        # Create main vertical box
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        self.set_child(main_box)
+        _install_panel_css()
+
+        # Build the whole tree detached and attach the root once at the
+        # end, so appends don't each queue a resize on a live hierarchy
+        main_box = Gtk.Box(orientation=_VERTICAL, spacing=0)
+        main_box.freeze_notify()
 
         # Create menu bar (placeholder)
         menu_bar = self._create_menu_bar()
@@ -92,127 +155,158 @@ class MainWindow(Gtk.ApplicationWindow):
         search_panel = self._create_search_panel()
         main_box.append(search_panel)
 
-        # Create main content area
-        content_area = self._create_content_area()
-        main_box.append(content_area)
+        # Content area slot; the results view itself is built lazily on
+        # first search so window show-up skips its realization cost.
+        # Until then a plain label carries the empty-state hint - far
+        # cheaper than realizing a view just to show static text.
+        self._content_slot = Gtk.Box(orientation=_VERTICAL)
+        self._content_slot.set_vexpand(True)
+        self._empty_hint = Gtk.Label(
+            label="No search performed yet.\n\n"
+            "Enter a filename, path, or regex pattern above to begin."
+        )
+        self._empty_hint.set_wrap(True)
+        self._empty_hint.set_vexpand(True)
+        self._content_slot.append(self._empty_hint)
+        main_box.append(self._content_slot)
 
         # Create status bar
         status_bar = self._create_status_bar()
         main_box.append(status_bar)
 
+        main_box.thaw_notify()
+        self.set_child(main_box)
+
     def _create_menu_bar(self) -> Gtk.Widget:
-        """Create the menu bar."""
-        # Simple label for now - will implement proper menu later
-        menu_bar = Gtk.Label(label="File  Edit  View  Search  Tools  Help")
-        menu_bar.set_halign(Gtk.Align.START)
-        menu_bar.add_css_class("menu-bar")
-        return menu_bar
+        """Create the menu bar from a Gio.Menu model."""
+        # GTK renders the popover bar from the cached model, and the
+        # items dispatch through the same window actions as the toolbar
+        menu = Gio.Menu()
+
+        file_menu = Gio.Menu()
+        file_menu.append("Refresh Database", "win.refresh_db")
+        menu.append_submenu("File", file_menu)
+
+        edit_menu = Gio.Menu()
+        edit_menu.append("Preferences", "win.preferences")
+        menu.append_submenu("Edit", edit_menu)
+
+        return Gtk.PopoverMenuBar.new_from_model(menu)
 
     def _create_toolbar(self) -> Gtk.Widget:
         """Create the toolbar."""
-        toolbar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        toolbar.set_margin_start(6)
-        toolbar.set_margin_end(6)
-        toolbar.set_margin_top(6)
-        toolbar.set_margin_bottom(6)
-
-        # Configure Paths button
-        config_btn = Gtk.Button(label="Configure Paths")
-        config_btn.connect("clicked", self._on_configure_paths_clicked)
-        toolbar.append(config_btn)
-
-        # Refresh DB button
-        self.refresh_btn = Gtk.Button(label="Refresh DB (Ctrl+Shift+R)")
-        self.refresh_btn.connect("clicked", self._on_refresh_db_clicked)
-        toolbar.append(self.refresh_btn)
-
-        # Separator
-        separator = Gtk.Separator(orientation=Gtk.Orientation.VERTICAL)
-        toolbar.append(separator)
-
-        # Analysis buttons
-        duplicates_btn = Gtk.Button(label="Find Duplicates")
-        duplicates_btn.connect("clicked", self._on_find_duplicates_clicked)
-        toolbar.append(duplicates_btn)
-
-        analysis_btn = Gtk.Button(label="Smart Analysis")
-        analysis_btn.connect("clicked", self._on_smart_analysis_clicked)
-        toolbar.append(analysis_btn)
-
-        empty_btn = Gtk.Button(label="Empty Folders")
-        empty_btn.connect("clicked", self._on_empty_folders_clicked)
-        toolbar.append(empty_btn)
+        toolbar = Gtk.Box(orientation=_HORIZONTAL, spacing=6)
+        toolbar.add_css_class("pad-6")
+
+        # (label, action) table; None inserts a separator. Binding each
+        # button to a window action gives buttons, menu items and
+        # shortcuts one dispatch path instead of per-button handlers.
+        buttons: List[Optional[Tuple[str, str]]] = [
+            ("Configure Paths", "win.configure_paths"),
+            ("Refresh DB (Ctrl+Shift+R)", "win.refresh_db"),
+            None,
+            ("Find Duplicates", "win.find_duplicates"),
+            ("Smart Analysis", "win.smart_analysis"),
+            ("Empty Folders", "win.empty_folders"),
+        ]
+
+        # One size group measures the widest label once per cycle instead
+        # of every button negotiating its own width on each resize
+        size_group = Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL)
+
+        for entry in buttons:
+            if entry is None:
+                separator = Gtk.Separator(orientation=_VERTICAL)
+                toolbar.append(separator)
+                continue
+
+            label, action_name = entry
+            button = Gtk.Button(label=label)
+            button.set_action_name(action_name)
+            size_group.add_widget(button)
+            toolbar.append(button)
+
+            if action_name == "win.refresh_db":
+                # Kept as an attribute so scan start/stop can relabel it
+                self.refresh_btn = button
 
         return toolbar
 
     def _create_search_panel(self) -> Gtk.Widget:
         """Create the search panel."""
-        search_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        search_box.set_margin_start(6)
-        search_box.set_margin_end(6)
-        search_box.set_margin_top(6)
-        search_box.set_margin_bottom(6)
-
-        # Search row
-        search_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        # A single grid replaces the vertical box with two nested rows;
+        # GTK's size-allocate cost grows with hierarchy depth, so fewer
+        # container levels means fewer measure passes per resize
+        grid = Gtk.Grid(column_spacing=6, row_spacing=6)
+        grid.add_css_class("pad-6")
 
+        # Row 0: label, entry, search and clear buttons
         search_label = Gtk.Label(label="Search:")
-        search_row.append(search_label)
+        grid.attach(search_label, 0, 0, 1, 1)
 
-        # Search entry
         self.search_entry = Gtk.Entry()
         self.search_entry.set_placeholder_text(
             "Enter filename, path, or regex pattern..."
         )
         self.search_entry.set_hexpand(True)
-        search_row.append(self.search_entry)
+        self.search_entry.connect("changed", self._on_search_changed)
+        self.search_entry.connect("activate", self._on_search_activate)
+        grid.attach(self.search_entry, 1, 0, 1, 1)
 
-        # Search button
         search_btn = Gtk.Button(label="Search")
         search_btn.connect("clicked", self._on_search_clicked)
-        search_row.append(search_btn)
+        grid.attach(search_btn, 2, 0, 1, 1)
 
-        # Clear button
         clear_btn = Gtk.Button(label="Clear")
         clear_btn.connect("clicked", self._on_clear_clicked)
-        search_row.append(clear_btn)
-
-        search_box.append(search_row)
-
-        # Filter checkboxes
-        filter_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        grid.attach(clear_btn, 3, 0, 1, 1)
 
+        # Row 1: filter checkboxes
         self.regex_check = Gtk.CheckButton(label="Regex Mode")
-        filter_row.append(self.regex_check)
-
         self.fullpath_check = Gtk.CheckButton(label="Full Path")
-        filter_row.append(self.fullpath_check)
-
         self.images_check = Gtk.CheckButton(label="Images Only")
-        filter_row.append(self.images_check)
-
         self.videos_check = Gtk.CheckButton(label="Videos Only")
-        filter_row.append(self.videos_check)
-
         self.docs_check = Gtk.CheckButton(label="Documents Only")
-        filter_row.append(self.docs_check)
 
-        search_box.append(filter_row)
+        filter_checks = (
+            ("regex", self.regex_check),
+            ("fullpath", self.fullpath_check),
+            ("images", self.images_check),
+            ("videos", self.videos_check),
+            ("docs", self.docs_check),
+        )
+        for column, (name, check) in enumerate(filter_checks):
+            check.connect("toggled", self._on_filter_toggled, name)
+            grid.attach(check, column, 1, 1, 1)
+
+        return grid
+
+    def _ensure_content_area(self) -> None:
+        """Build the results area on first use.
+
+        Realizing the tree view and its columns is the most expensive part
+        of window construction; users who only scan or configure paths
+        never pay for it.
+        """
+        if self.results_tree is not None or not self._content_slot:
+            return
 
-        return search_box
+        if self._empty_hint is not None:
+            self._content_slot.remove(self._empty_hint)
+            self._empty_hint = None
+        self._content_slot.append(self._create_content_area())
 
     def _create_content_area(self) -> Gtk.Widget:
         """Create the main content area."""
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        content_box.set_margin_start(6)
-        content_box.set_margin_end(6)
+        content_box = Gtk.Box(orientation=_VERTICAL, spacing=6)
+        content_box.add_css_class("pad-sides-6")
         content_box.set_vexpand(True)
 
         # Results header
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        header_box = Gtk.Box(orientation=_HORIZONTAL, spacing=6)
 
         self.results_label = Gtk.Label(label="Search Results: 0 files found")
-        self.results_label.set_halign(Gtk.Align.START)
+        self.results_label.set_halign(_ALIGN_START)
         self.results_label.set_hexpand(True)
         header_box.append(self.results_label)
 
@@ -232,24 +326,30 @@ class MainWindow(Gtk.ApplicationWindow):
 
         # Create TreeView with columns
         self.results_store = Gtk.ListStore(
-            str, str, str, str, str, str
-        )  # filename, type, size, modified, path, extension
+            str, str, str, str, str
+        )  # filename, type, size, modified, path
         self.results_tree = Gtk.TreeView(model=self.results_store)
-        # Add columns
+        # Add columns; fixed sizing is required for fixed-height mode
         columns = [
-            ("Filename", 0),
-            ("Type", 1),
-            ("Size", 2),
-            ("Modified", 3),
-            ("Location", 4),
+            ("Filename", 0, 260),
+            ("Type", 1, 90),
+            ("Size", 2, 90),
+            ("Modified", 3, 140),
+            ("Location", 4, 320),
         ]
-        for title, col_id in columns:
+        for title, col_id, width in columns:
             renderer = Gtk.CellRendererText()
             column = Gtk.TreeViewColumn(title, renderer, text=col_id)
+            column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+            column.set_fixed_width(width)
             column.set_resizable(True)
             column.set_sort_column_id(col_id)
             self.results_tree.append_column(column)
 
+        # Every row is one line of text, so let the view measure a single
+        # row and multiply instead of measuring all N rows per layout
+        self.results_tree.set_fixed_height_mode(True)
+
         # Connect double-click to open file
         self.results_tree.connect("row-activated", self._on_file_activated)
 
@@ -260,76 +360,144 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def _create_status_bar(self) -> Gtk.Widget:
         """Create the status bar."""
-        status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        status_box.set_margin_start(6)
-        status_box.set_margin_end(6)
-        status_box.set_margin_top(3)
-        status_box.set_margin_bottom(3)
+        status_box = Gtk.Box(orientation=_HORIZONTAL, spacing=6)
+        status_box.add_css_class("pad-3-6")
 
         self.status_label = Gtk.Label(label="Ready")
-        self.status_label.set_halign(Gtk.Align.START)
+        self.status_label.set_halign(_ALIGN_START)
         self.status_label.set_hexpand(True)
         status_box.append(self.status_label)
 
-        # Progress bar (hidden initially)
+        # Progress bar, hidden behind a revealer: toggling reveal-child
+        # animates without the map/unmap and parent reallocation that
+        # set_visible causes on every scan start/stop
         self.progress_bar = Gtk.ProgressBar()
         self.progress_bar.set_size_request(200, -1)
-        self.progress_bar.set_visible(False)
-        status_box.append(self.progress_bar)
+        self._progress_revealer = Gtk.Revealer()
+        self._progress_revealer.set_transition_type(
+            Gtk.RevealerTransitionType.CROSSFADE
+        )
+        self._progress_revealer.set_child(self.progress_bar)
+        status_box.append(self._progress_revealer)
 
         return status_box
 
     def _setup_actions(self) -> None:
         """Set up window actions."""
-        # Refresh action
-        refresh_action = Gio.SimpleAction.new("refresh_db", None)
-        refresh_action.connect("activate", self._on_refresh_db_action)
-        self.add_action(refresh_action)
+        handlers = (
+            ("configure_paths", self._on_configure_paths_action),
+            ("refresh_db", self._on_refresh_db_action),
+            ("find_duplicates", self._on_find_duplicates_action),
+            ("smart_analysis", self._on_smart_analysis_action),
+            ("empty_folders", self._on_empty_folders_action),
+            ("preferences", self._on_preferences_action),
+        )
+        for name, handler in handlers:
+            action = Gio.SimpleAction.new(name, None)
+            action.connect("activate", handler)
+            self.add_action(action)
+
+    def _on_close_request(self, window: Gtk.Window) -> bool:
+        """Release the worker pool when the window closes."""
+        # Worker threads are non-daemon; without this a slow query would
+        # keep the process alive after the window is gone
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        return False  # Allow the window to close
 
-        # Preferences action
-        prefs_action = Gio.SimpleAction.new("preferences", None)
-        prefs_action.connect("activate", self._on_preferences_action)
-        self.add_action(prefs_action)
+    # Minimum seconds between progress updates reaching the main loop
+    _PROGRESS_INTERVAL = 0.05
 
     def _setup_scanner_callbacks(self) -> None:
-        """Set up file scanner progress callbacks."""
+        """Set up file scanner progress callbacks.
+
+        Ticks are coalesced on the scanner thread to at most ~20 per
+        second; scheduling an idle callback per tick would wake the
+        main loop and re-layout the status bar once per file. The
+        final tick (scanned == total) always goes through so the bar
+        ends at 100%.
+        """
+        last_ts = 0.0
 
         def progress_callback(scanned: int, total: int, message: str) -> None:
+            nonlocal last_ts
+            now = time.monotonic()
+            if scanned != total and now - last_ts < self._PROGRESS_INTERVAL:
+                return
+            last_ts = now
             # Use GLib.idle_add to update UI from background thread
             GLib.idle_add(self._update_scan_progress, scanned, total, message)
 
         self.file_scanner.set_progress_callback(progress_callback)
 
     def _refresh_stats(self) -> None:
-        """Refresh database statistics display."""
-        stats = self.db_manager.get_file_stats()
+        """Refresh database statistics display.
+
+        The aggregate query scans the whole files table, so it runs on
+        the query pool and only the label update touches the widget.
+        """
+        if self.status_label:
+            self.status_label.set_text("Loading stats...")
+
+        def stats_worker() -> None:
+            try:
+                stats = self.db_manager.get_file_stats()
+            except Exception as e:
+                self.logger.error("Failed to load stats: %s", e)
+                return
+            GLib.idle_add(self._display_stats, stats)
+
+        self._executor.submit(stats_worker)
+
+    def _display_stats(self, stats: Dict[str, Any]) -> bool:
+        """Show fetched statistics in the status label (main thread)."""
         if self.status_label:
             self.status_label.set_text(
                 f"Database: {stats['total_files']} files, "
                 f"{stats['total_size'] // 1024} KB total"
             )
+        return False
 
         # Event Handlers
 
-    def _on_configure_paths_clicked(self, button: Gtk.Button) -> None:
-        """Handle configure paths button click."""
+    def _on_configure_paths_action(
+        self, action: Gio.SimpleAction, parameter: None
+    ) -> None:
+        """Handle configure paths action."""
         self._show_config_dialog()
 
-    def _on_refresh_db_clicked(self, button: Gtk.Button) -> None:
-        """Handle refresh database button click."""
-        if self._scanning:
-            self._stop_scan()
-        else:
-            self._start_scan()
-
     def _on_search_clicked(self, button: Gtk.Button) -> None:
         """Handle search button click."""
         self._perform_search()
 
     def _on_search_activate(self, entry: Gtk.Entry) -> None:
         """Handle Enter key in search entry."""
+        self._cancel_search_debounce()
         self._perform_search()
 
+    def _on_filter_toggled(self, check: Gtk.CheckButton, name: str) -> None:
+        """Mirror a filter checkbox into the shadow state."""
+        self._filter_state[name] = check.get_active()
+
+    def _on_search_changed(self, entry: Gtk.Entry) -> None:
+        """Debounce keystrokes so at most one search runs per interval."""
+        self._cancel_search_debounce()
+        self._search_debounce_id = GLib.timeout_add(
+            SEARCH_DEBOUNCE_MS, self._on_search_debounce_timeout
+        )
+
+    def _on_search_debounce_timeout(self) -> bool:
+        """Run the search queued by the last keystroke burst."""
+        self._search_debounce_id = 0
+        if self.search_entry and self.search_entry.get_text().strip():
+            self._perform_search()
+        return False  # One-shot timeout
+
+    def _cancel_search_debounce(self) -> None:
+        """Drop any pending debounced search."""
+        if self._search_debounce_id:
+            GLib.source_remove(self._search_debounce_id)
+            self._search_debounce_id = 0
+
     def _on_clear_clicked(self, button: Gtk.Button) -> None:
         """Handle clear button click."""
         if self.search_entry:
@@ -338,18 +506,24 @@ class MainWindow(Gtk.ApplicationWindow):
         if self.status_label:
             self.status_label.set_text("Search cleared")
 
-    def _on_find_duplicates_clicked(self, button: Gtk.Button) -> None:
-        """Handle find duplicates button click."""
+    def _on_find_duplicates_action(
+        self, action: Gio.SimpleAction, parameter: None
+    ) -> None:
+        """Handle find duplicates action."""
         duplicate_window = DuplicateWindow(self, self.db_manager)
         duplicate_window.show()
 
-    def _on_smart_analysis_clicked(self, button: Gtk.Button) -> None:
-        """Handle smart analysis button click."""
+    def _on_smart_analysis_action(
+        self, action: Gio.SimpleAction, parameter: None
+    ) -> None:
+        """Handle smart analysis action."""
         if self.status_label:
             self.status_label.set_text("Smart analysis - not implemented yet")
 
-    def _on_empty_folders_clicked(self, button: Gtk.Button) -> None:
-        """Handle empty folders button click."""
+    def _on_empty_folders_action(
+        self, action: Gio.SimpleAction, parameter: None
+    ) -> None:
+        """Handle empty folders action."""
         if self.status_label:
             self.status_label.set_text("Empty folder detection - not implemented yet")
 
@@ -365,8 +539,11 @@ class MainWindow(Gtk.ApplicationWindow):
         self._open_file(file_path)
 
     def _on_refresh_db_action(self, action: Gio.SimpleAction, parameter: None) -> None:
-        """Handle refresh database action (keyboard shortcut)."""
-        self._on_refresh_db_clicked(None)  # type: ignore
+        """Handle refresh database action (toolbar or keyboard shortcut)."""
+        if self._scanning:
+            self._stop_scan()
+        else:
+            self._start_scan()
 
     def _on_preferences_action(self, action: Gio.SimpleAction, parameter: None) -> None:
         """Handle preferences action."""
@@ -378,64 +555,71 @@ class MainWindow(Gtk.ApplicationWindow):
         if not self.search_entry:
             return
 
+        self._ensure_content_area()
+
         query = self.search_entry.get_text().strip()
 
-        # Build search filters
+        # Build search filters from the shadow state
+        state = self._filter_state
         file_types = []
-        if self.images_check and self.images_check.get_active():
+        if state["images"]:
             file_types.append("image")
-        if self.videos_check and self.videos_check.get_active():
+        if state["videos"]:
             file_types.append("video")
-        if self.docs_check and self.docs_check.get_active():
+        if state["docs"]:
             file_types.append("document")
 
         filters = SearchFilters(
             query=query,
             file_types=file_types if file_types else None,
-            use_regex=self.regex_check.get_active() if self.regex_check else False,
-            search_path=(
-                self.fullpath_check.get_active() if self.fullpath_check else False
-            ),
+            use_regex=state["regex"],
+            search_path=state["fullpath"],
         )
 
-        # Perform search in background thread
-        def search_worker():
+        # Run the query on the shared pool; results are marshalled back
+        # to the main thread via idle_add, so no widget is touched here.
+        # The sequence tag guards against the two pool workers finishing
+        # out of order and an older result set overwriting a newer one.
+        self._search_seq += 1
+        seq = self._search_seq
+
+        def search_worker() -> None:
             try:
                 results = self.search_engine.search(filters)
-                GLib.idle_add(self._display_search_results, results, query)
+                GLib.idle_add(self._display_search_results, results, query, seq)
             except Exception as e:
                 GLib.idle_add(self._show_error, f"Search failed: {e}")
 
-        threading.Thread(target=search_worker, daemon=True).start()
+        self._executor.submit(search_worker)
 
         if self.status_label:
             self.status_label.set_text(f"Searching for '{query}'...")
 
     def _display_search_results(
-        self, results: List[Dict[str, Any]], query: str
+        self, results: List[Dict[str, Any]], query: str, seq: int
     ) -> None:
         """Display search results in the TreeView."""
+        if seq != self._search_seq:
+            return  # A newer search was submitted; drop this result set
         if not self.results_store or not self.results_label:
             return
 
-        # Clear previous results
-        self.results_store.clear()
-
-        # Add new results
-        for result in results:
-            size_str = self._format_file_size(result["size"])
-            modified_str = self._format_date(result["modified_date"])
-
-            self.results_store.append(
-                [
-                    result["filename"],
-                    result["file_type"].title(),
-                    size_str,
-                    modified_str,
-                    result["path"],
-                    result.get("extension", ""),
-                ]
+        # Bind the per-row callables to locals; attribute and global
+        # lookups inside a 10k-iteration loop are measurable overhead
+        type_label = TYPE_LABELS.get
+        fmt_size = self._format_file_size
+        fmt_date = self._format_date
+        rows = [
+            (
+                result["filename"],
+                type_label(result["file_type"], result["file_type"]),
+                fmt_size(result["size"]),
+                fmt_date(result["modified_date"]),
+                result["path"],
             )
+            for result in results
+        ]
+        self._populate_results(rows)
 
         # Update results label
         self.results_label.set_text(f"Search Results: {len(results)} files found")
@@ -443,8 +627,85 @@ class MainWindow(Gtk.ApplicationWindow):
         if self.status_label:
             self.status_label.set_text(f"Found {len(results)} files matching '{query}'")
 
+    # Rows inserted per idle callback while repopulating the results list
+    _RESULTS_CHUNK_SIZE = 500
+
+    def _populate_results(self, rows: List[Tuple[str, str, str, str, str]]) -> None:
+        """Replace the results store contents in idle-sized chunks.
+
+        Appending row by row into a live model emits row-inserted,
+        re-sorts and redraws per row, and doing all inserts in one go
+        blocks the main loop for large result sets. The model is detached,
+        sorting disabled, and the rows stream in over batched idle
+        callbacks so GTK keeps dispatching events in between.
+        """
+        if not self.results_store or not self.results_tree:
+            return
+
+        if self._results_fill_id:
+            # A fill is in flight: cancel it but keep the model and sort
+            # settings it captured, since the tree is still detached
+            GLib.source_remove(self._results_fill_id)
+            self._results_fill_id = 0
+        else:
+            self._results_fill_model = self.results_tree.get_model()
+            self.results_tree.set_model(None)
+            sort = self.results_store.get_sort_column_id()
+            self._results_fill_sort = (sort[0], sort[1], sort[2])
+            if sort[0]:
+                # -2 == GTK_TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID
+                self.results_store.set_sort_column_id(-2, sort[2])
+
+        self.results_store.clear()
+
+        # Reverse order so each batch prepends at position 0: appending
+        # makes GTK walk to the list tail, which is accidentally O(n^2)
+        self._results_fill_queue = rows[::-1]
+        self._results_fill_id = GLib.idle_add(
+            self._fill_results_step, priority=GLib.PRIORITY_DEFAULT_IDLE
+        )
+
+    def _fill_results_step(self) -> bool:
+        """Insert one batch of result rows; reschedules itself until done."""
+        if not self.results_store:
+            self._results_fill_id = 0
+            return False
+
+        batch = self._results_fill_queue[: self._RESULTS_CHUNK_SIZE]
+        del self._results_fill_queue[: self._RESULTS_CHUNK_SIZE]
+
+        insert = self.results_store.insert_with_values
+        columns = (0, 1, 2, 3, 4)
+        for row in batch:
+            insert(0, columns, row)
+
+        if self._results_fill_queue:
+            return True  # More batches pending; run again on next idle
+
+        self._results_fill_id = 0
+        sorted_before, sort_col, sort_order = self._results_fill_sort
+        if sorted_before:
+            self.results_store.set_sort_column_id(sort_col, sort_order)
+        if self.results_tree:
+            self.results_tree.set_model(self._results_fill_model)
+        self._results_fill_model = None
+        return False
+
     def _clear_results(self) -> None:
         """Clear search results."""
+        if self._results_fill_id:
+            # A fill is streaming in: cancel it, drop the queued rows,
+            # and restore the sort column and detached model it captured
+            GLib.source_remove(self._results_fill_id)
+            self._results_fill_id = 0
+            self._results_fill_queue = []
+            if self.results_store:
+                sorted_before, sort_col, sort_order = self._results_fill_sort
+                if sorted_before:
+                    self.results_store.set_sort_column_id(sort_col, sort_order)
+            if self.results_tree:
+                self.results_tree.set_model(self._results_fill_model)
+            self._results_fill_model = None
         if self.results_store:
             self.results_store.clear()
         if self.results_label:
@@ -466,13 +727,37 @@ class MainWindow(Gtk.ApplicationWindow):
             )
             return
 
+        # Canonicalize once at the UI boundary: expand ~, resolve
+        # symlinks and dedupe, then drop entries nested under another
+        # entry so the scanner never walks the same subtree twice
+        resolved = sorted(
+            {os.path.realpath(os.path.expanduser(d)) for d in directories}
+        )
+        directories = [
+            d
+            for i, d in enumerate(resolved)
+            if not any(d.startswith(p + os.sep) for p in resolved[:i])
+        ]
+
+        # One stat per configured root up front; missing entries are
+        # reported instead of being silently skipped mid-scan
+        missing = [d for d in directories if not os.path.isdir(d)]
+        if missing:
+            self._show_error(
+                "Configured scan directories do not exist: " + ", ".join(missing)
+            )
+            directories = [d for d in directories if d not in missing]
+            if not directories:
+                return
+
         self._scanning = True
         if self.refresh_btn:
             self.refresh_btn.set_label("Stop Scan")
 
         if self.progress_bar:
-            self.progress_bar.set_visible(True)
             self.progress_bar.set_fraction(0.0)
+        if self._progress_revealer:
+            self._progress_revealer.set_reveal_child(True)
 
         def scan_worker():
             try:
@@ -500,8 +785,8 @@ class MainWindow(Gtk.ApplicationWindow):
         if self.refresh_btn:
             self.refresh_btn.set_label("Refresh DB (Ctrl+Shift+R)")
 
-        if self.progress_bar:
-            self.progress_bar.set_visible(False)
+        if self._progress_revealer:
+            self._progress_revealer.set_reveal_child(False)
 
         if self.status_label:
             self.status_label.set_text(
@@ -510,6 +795,8 @@ class MainWindow(Gtk.ApplicationWindow):
                 f"{results['files_updated']} updated in {results['duration']:.1f}s"
             )
 
+        # Scan changed the corpus; cached suggestions are stale
+        self.search_engine.clear_suggestion_cache()
         self._refresh_stats()
 
     def _scan_failed(self, error: str) -> None:
@@ -518,14 +805,17 @@ class MainWindow(Gtk.ApplicationWindow):
         if self.refresh_btn:
             self.refresh_btn.set_label("Refresh DB (Ctrl+Shift+R)")
 
-        if self.progress_bar:
-            self.progress_bar.set_visible(False)
+        if self._progress_revealer:
+            self._progress_revealer.set_reveal_child(False)
 
         self._show_error(f"Scan failed: {error}")
 
     def _update_scan_progress(self, scanned: int, total: int, message: str) -> None:
         """Update scan progress display."""
-        if self.progress_bar and self.progress_bar.get_visible():
+        revealed = (
+            self._progress_revealer and self._progress_revealer.get_reveal_child()
+        )
+        if self.progress_bar and revealed:
             if total > 0:
                 fraction = min(scanned / total, 1.0)
                 self.progress_bar.set_fraction(fraction)
@@ -536,14 +826,16 @@ class MainWindow(Gtk.ApplicationWindow):
     def _find_duplicates(self) -> None:
         """Find and display duplicate files."""
 
-        def duplicate_worker():
+        self._ensure_content_area()
+
+        def duplicate_worker() -> None:
             try:
                 duplicates = self.search_engine.search_duplicates()
                 GLib.idle_add(self._display_duplicates, duplicates)
             except Exception as e:
                 GLib.idle_add(self._show_error, f"Duplicate search failed: {e}")
 
-        threading.Thread(target=duplicate_worker, daemon=True).start()
+        self._executor.submit(duplicate_worker)
 
         if self.status_label:
             self.status_label.set_text("Searching for duplicates...")
@@ -553,25 +845,25 @@ class MainWindow(Gtk.ApplicationWindow):
         if not self.results_store or not self.results_label:
             return
 
-        self.results_store.clear()
-
         total_duplicates = 0
+        rows: List[Tuple[str, str, str, str, str]] = []
+        append_row = rows.append
+        type_label = TYPE_LABELS.get
+        fmt_size = self._format_file_size
+        fmt_date = self._format_date
         for group_name, files in duplicates.items():
             total_duplicates += len(files)
             for file_info in files:
-                size_str = self._format_file_size(file_info["size"])
-                modified_str = self._format_date(file_info["modified_date"])
-
-                self.results_store.append(
-                    [
+                append_row(
+                    (
                         f"[DUP] {file_info['filename']}",
-                        file_info["file_type"].title(),
-                        size_str,
-                        modified_str,
+                        type_label(file_info["file_type"], file_info["file_type"]),
+                        fmt_size(file_info["size"]),
+                        fmt_date(file_info["modified_date"]),
                         file_info["path"],
-                        file_info.get("extension", ""),
-                    ]
+                    )
                 )
+        self._populate_results(rows)
 
         if self.results_label:
             self.results_label.set_text(
@@ -589,11 +881,11 @@ class MainWindow(Gtk.ApplicationWindow):
     def _open_file(self, file_path: str) -> None:
         """Open file with default application."""
         try:
-            import subprocess
-
-            subprocess.run(["xdg-open", file_path], check=False)
-            if self.status_label:
-                self.status_label.set_text(f"Opened: {file_path}")
+            if launch_default(file_path):
+                if self.status_label:
+                    self.status_label.set_text(f"Opened: {file_path}")
+            else:
+                self._show_error(f"No application available to open {file_path}")
         except Exception as e:
             self._show_error(f"Cannot open file: {e}")
 
@@ -606,22 +898,16 @@ class MainWindow(Gtk.ApplicationWindow):
     # Utility methods
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human readable format."""
-        size = float(size_bytes)
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size = size / 1024.0
-        return f"{size:.1f} TB"
+        return format_size(size_bytes)
 
     def _format_date(self, timestamp: float) -> str:
         """Format timestamp as readable date."""
-        import datetime
-
-        dt = datetime.datetime.fromtimestamp(timestamp)
-        return dt.strftime("%Y-%m-%d %H:%M")
+        return format_timestamp(timestamp)
 
     def _show_config_dialog(self) -> None:
         """Show configuration dialog."""
+        # Imported lazily: the dialog is rarely opened and the import
+        # would otherwise pull GTK dialog machinery in at startup
         from isearch.ui.config_dialog import ConfigDialog
 
         config_manager = self.config_manager or ConfigManager()
@@ -1,9 +1,12 @@
 """Configuration management for isearch application."""
 
+import copy
+import functools
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from isearch.utils.constants import (
     DEFAULT_CONFIG_PATH,
@@ -11,6 +14,18 @@ from isearch.utils.constants import (
     WINDOW_DEFAULT_HEIGHT,
 )
 
+# Parsed configs keyed by path, guarded by mtime: scans construct fresh
+# ConfigManager instances, and re-parsing an unchanged file is wasted work
+_CONFIG_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted config key once and cache the parts."""
+    return tuple(key.split("."))
+
 
 class ConfigManager:
     """Manages application configuration."""
@@ -67,47 +82,76 @@ class ConfigManager:
         """Load configuration from file."""
         try:
             if self.config_path.exists():
+                mtime_ns = self.config_path.stat().st_mtime_ns
+                cached = _CONFIG_CACHE.get(self.config_path)
+                if cached is not None and cached[0] == mtime_ns:
+                    # Deep copy so per-instance set() calls don't leak
+                    # into other managers sharing the cache entry
+                    self._config = copy.deepcopy(cached[1])
+                    return
+
                 with open(self.config_path, "r", encoding="utf-8") as f:
                     loaded_config = json.load(f)
 
                 # Merge with defaults to ensure all keys exist
                 self._config = self.get_default_config()
                 self._deep_update(self._config, loaded_config)
+                _CONFIG_CACHE[self.config_path] = (
+                    mtime_ns,
+                    copy.deepcopy(self._config),
+                )
 
-                self.logger.info(f"Configuration loaded from {self.config_path}")
+                self.logger.info("Configuration loaded from %s", self.config_path)
             else:
                 self._config = self.get_default_config()
                 self.save_config()
                 self.logger.info("Created default configuration")
 
         except (json.JSONDecodeError, IOError) as e:
-            self.logger.error(f"Error loading config: {e}")
+            self.logger.error("Error loading config: %s", e)
             self._config = self.get_default_config()
 
     def save_config(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file.
+
+        Serializes once to a string, writes to a sibling temp file and
+        renames it over the config. The rename is atomic, so a crash
+        mid-write leaves the previous config intact instead of a
+        truncated file.
+        """
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
-            self.logger.info(f"Configuration saved to {self.config_path}")
+            payload = json.dumps(self._config, indent=2, ensure_ascii=False)
+            tmp_path = self.config_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            _CONFIG_CACHE[self.config_path] = (
+                self.config_path.stat().st_mtime_ns,
+                copy.deepcopy(self._config),
+            )
+            self.logger.info("Configuration saved to %s", self.config_path)
         except IOError as e:
-            self.logger.error(f"Error saving config: {e}")
+            self.logger.error("Error saving config: %s", e)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key path."""
-        keys = key.split(".")
-        value = self._config
-
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        value: Any = self._config
+
+        # Sentinel-checked walk: a miss costs one compare instead of an
+        # exception unwind, and the key split is cached per key string
+        for part in _split_key(key):
+            if not isinstance(value, dict):
+                return default
+            value = value.get(part, _MISSING)
+            if value is _MISSING:
+                return default
+        return value
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value by key path."""
-        keys = key.split(".")
+        keys = _split_key(key)
         config = self._config
 
         # Navigate to parent of target key
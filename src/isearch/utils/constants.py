@@ -1,5 +1,7 @@
 """Application constants and configuration."""
 
+import functools
+import types
 from pathlib import Path
 
 # Application metadata
@@ -20,54 +22,66 @@ DEFAULT_DB_PATH = DATA_DIR / "files.db"
 DEFAULT_CONFIG_PATH = CONFIG_DIR / "config.json"
 
 # File type categories
-IMAGE_EXTENSIONS = {
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".gif",
-    ".bmp",
-    ".tiff",
-    ".tif",
-    ".webp",
-    ".svg",
-    ".ico",
-    ".raw",
-    ".cr2",
-    ".nef",
-    ".arw",
-}
+IMAGE_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".bmp",
+        ".tiff",
+        ".tif",
+        ".webp",
+        ".svg",
+        ".ico",
+        ".raw",
+        ".cr2",
+        ".nef",
+        ".arw",
+    }
+)
 
-VIDEO_EXTENSIONS = {
-    ".mp4",
-    ".avi",
-    ".mkv",
-    ".mov",
-    ".wmv",
-    ".flv",
-    ".webm",
-    ".m4v",
-    ".3gp",
-    ".ogv",
-    ".ts",
-    ".m2ts",
-    ".mts",
-}
+VIDEO_EXTENSIONS = frozenset(
+    {
+        ".mp4",
+        ".avi",
+        ".mkv",
+        ".mov",
+        ".wmv",
+        ".flv",
+        ".webm",
+        ".m4v",
+        ".3gp",
+        ".ogv",
+        ".ts",
+        ".m2ts",
+        ".mts",
+    }
+)
 
-DOCUMENT_EXTENSIONS = {
-    ".pdf",
-    ".doc",
-    ".docx",
-    ".txt",
-    ".rtf",
-    ".odt",
-    ".ods",
-    ".odp",
-    ".xls",
-    ".xlsx",
-    ".ppt",
-    ".pptx",
-    ".csv",
-}
+DOCUMENT_EXTENSIONS = frozenset(
+    {
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".txt",
+        ".rtf",
+        ".odt",
+        ".ods",
+        ".odp",
+        ".xls",
+        ".xlsx",
+        ".ppt",
+        ".pptx",
+        ".csv",
+    }
+)
+
+AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".flac", ".ogg", ".m4a", ".aac"})
+
+ARCHIVE_EXTENSIONS = frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"})
+
+CODE_EXTENSIONS = frozenset({".py", ".js", ".html", ".css", ".cpp", ".c", ".java"})
 
 # UI constants
 WINDOW_DEFAULT_WIDTH = 1200
@@ -80,22 +94,38 @@ SEARCH_DEBOUNCE_MS = 300
 MAX_SEARCH_RESULTS = 10000
 
 
+# Display labels for the known file types; computed once so result
+# lists don't call str.title() per row
+TYPE_LABELS = {
+    t: t.title()
+    for t in ("image", "video", "document", "audio", "archive", "code", "other")
+}
+
+
+# Extension -> type lookup derived from the category sets above, made
+# read-only so the categories stay the single source of truth
+FILE_TYPE_BY_EXT = types.MappingProxyType(
+    {
+        extension: file_type
+        for file_type, extensions in (
+            ("image", IMAGE_EXTENSIONS),
+            ("video", VIDEO_EXTENSIONS),
+            ("document", DOCUMENT_EXTENSIONS),
+            ("audio", AUDIO_EXTENSIONS),
+            ("archive", ARCHIVE_EXTENSIONS),
+            ("code", CODE_EXTENSIONS),
+        )
+        for extension in extensions
+    }
+)
+
+
 # File type detection
+@functools.lru_cache(maxsize=256)
 def get_file_type(extension: str) -> str:
-    """Determine file type from extension."""
-    ext_lower = extension.lower()
-
-    if ext_lower in IMAGE_EXTENSIONS:
-        return "image"
-    elif ext_lower in VIDEO_EXTENSIONS:
-        return "video"
-    elif ext_lower in DOCUMENT_EXTENSIONS:
-        return "document"
-    elif ext_lower in {".mp3", ".wav", ".flac", ".ogg", ".m4a", ".aac"}:
-        return "audio"
-    elif ext_lower in {".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"}:
-        return "archive"
-    elif ext_lower in {".py", ".js", ".html", ".css", ".cpp", ".c", ".java"}:
-        return "code"
-    else:
-        return "other"
+    """Determine file type from extension.
+
+    Cached per extension string; a scan sees a handful of distinct
+    extensions across millions of files, so nearly every call is a hit.
+    """
+    return FILE_TYPE_BY_EXT.get(extension.lower(), "other")
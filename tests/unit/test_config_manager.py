@@ -0,0 +1,51 @@
+"""Tests for configuration management."""
+
+import json
+import pytest
+import tempfile
+from pathlib import Path
+
+from isearch.utils.config_manager import ConfigManager
+
+
+@pytest.fixture
+def config_path():
+    """Provide a temporary config file path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir) / "config.json"
+
+
+def test_creates_default_config(config_path):
+    """Test that a missing config file is created with defaults."""
+    manager = ConfigManager(config_path)
+
+    assert config_path.exists()
+    assert manager.get("version") == "1.0"
+    assert manager.get_scan_directories()
+
+
+def test_load_merges_with_defaults(config_path):
+    """Test that partial configs are merged with defaults."""
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(json.dumps({"scan_directories": ["/data"]}))
+
+    manager = ConfigManager(config_path)
+
+    assert manager.get_scan_directories() == ["/data"]
+    # Keys absent from the file come from the defaults
+    assert manager.get("search_options.max_results") == 10000
+
+
+def test_cached_reload_is_isolated(config_path):
+    """Test that cache hits don't share state between managers."""
+    first = ConfigManager(config_path)
+    first.set("ui_preferences.thumbnail_size", 300)
+
+    # Same unchanged file: served from the cache, without first's edits
+    second = ConfigManager(config_path)
+    assert second.get("ui_preferences.thumbnail_size") == 150
+
+    # Saving updates the file and the cache
+    first.save_config()
+    third = ConfigManager(config_path)
+    assert third.get("ui_preferences.thumbnail_size") == 300
@@ -1,8 +1,6 @@
 """Tests for database functionality."""
 
 import pytest
-import tempfile
-from pathlib import Path
 import time
 
 from isearch.core.database import DatabaseManager
@@ -10,21 +8,56 @@ from isearch.core.database import DatabaseManager
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        yield DatabaseManager(db_path)
+    """Create an in-memory database for testing."""
+    yield DatabaseManager(":memory:")
 
 
 def test_database_initialization(temp_db):
     """Test database initialization."""
-    assert temp_db.db_path.exists()
-
     # Check that tables were created
     stats = temp_db.get_file_stats()
     assert stats["total_files"] == 0
 
 
+def test_fts_index_stays_in_sync_on_reinsert(temp_db):
+    """Test re-adding an existing path leaves no stale FTS entries."""
+    file_info = {
+        "path": "/test/report.txt",
+        "filename": "report.txt",
+        "directory": "/test",
+        "size": 1024,
+        "modified_date": time.time(),
+        "file_type": "document",
+        "extension": ".txt",
+    }
+    temp_db.add_file(file_info)
+    file_info["size"] = 2048
+    temp_db.add_file(file_info)  # INSERT OR REPLACE of the same path
+
+    with temp_db._get_connection() as conn:
+        # Raises "database disk image is malformed" if the REPLACE
+        # leaked a stale entry for the old rowid
+        conn.execute(
+            "INSERT INTO files_fts(files_fts, rank) VALUES('integrity-check', 1)"
+        )
+        indexed = [
+            row[0]
+            for row in conn.execute(
+                "SELECT rowid FROM files_fts WHERE files_fts MATCH ?",
+                ('filename: "report"',),
+            )
+        ]
+        live = [row[0] for row in conn.execute("SELECT id FROM files")]
+    assert indexed == live
+
+
+def test_database_initialization_on_disk(tmp_path):
+    """Test the on-disk path still creates the database file."""
+    db = DatabaseManager(tmp_path / "test.db")
+    assert db.db_path.exists()
+    assert db.get_file_stats()["total_files"] == 0
+
+
 def test_add_and_get_file(temp_db):
     """Test adding and retrieving a file."""
     file_info = {
@@ -72,8 +105,7 @@ def test_search_files(temp_db):
         },
     ]
 
-    for file_info in files:
-        temp_db.add_file(file_info)
+    temp_db.add_files(files)
 
     # Test filename search
     results = temp_db.search_files("document")
@@ -113,6 +145,58 @@ def test_file_stats(temp_db):
     assert stats["file_types"][0]["file_type"] == "document"
 
 
+def test_add_files_batch(temp_db):
+    """Test batch insert stores all rows."""
+    added = temp_db.add_files(
+        {
+            "path": f"/test/batch{i}.txt",
+            "filename": f"batch{i}.txt",
+            "directory": "/test",
+            "size": 1024,
+            "modified_date": time.time(),
+            "file_type": "document",
+            "extension": ".txt",
+        }
+        for i in range(5)
+    )
+    assert added == 5
+    assert temp_db.add_files([]) == 0
+
+    files = temp_db.search_files()
+    assert len(files) == 5
+
+
+def test_remove_files_by_paths(temp_db):
+    """Test bulk file removal."""
+    # Add test files
+    temp_db.add_files(
+        {
+            "path": f"/test/file{i}.txt",
+            "filename": f"file{i}.txt",
+            "directory": "/test",
+            "size": 1024,
+            "modified_date": time.time(),
+            "file_type": "document",
+            "extension": ".txt",
+        }
+        for i in range(3)
+    )
+
+    # Remove two of them in one call (missing paths are ignored)
+    removed = temp_db.remove_files_by_paths(
+        ["/test/file0.txt", "/test/file2.txt", "/test/missing.txt"]
+    )
+    assert removed == 2
+
+    # Only the remaining file is left
+    files = temp_db.search_files()
+    assert len(files) == 1
+    assert files[0]["filename"] == "file1.txt"
+
+    # Empty input is a no-op
+    assert temp_db.remove_files_by_paths([]) == 0
+
+
 def test_scan_session_tracking(temp_db):
     """Test scan session tracking."""
     # Start scan session
@@ -0,0 +1,90 @@
+"""Tests for duplicate detection algorithms."""
+
+import pytest
+import tempfile
+from pathlib import Path
+
+from isearch.core.database import DatabaseManager
+from isearch.core.duplicate_detector import DuplicateDetector
+
+
+@pytest.fixture
+def temp_detector():
+    """Create a duplicate detector backed by an in-memory database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_manager = DatabaseManager(":memory:")
+        detector = DuplicateDetector(db_manager)
+        yield detector, db_manager, Path(tmpdir)
+
+
+def _add_record(db_manager, path, size, content=None):
+    """Insert a file record, optionally backing it with a real file."""
+    path = Path(path)
+    if content is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+    db_manager.add_file(
+        {
+            "path": str(path),
+            "filename": path.name,
+            "directory": str(path.parent),
+            "size": size,
+            "modified_date": 1000000.0,
+            "file_type": "document",
+            "extension": path.suffix,
+        }
+    )
+
+
+def test_size_name_detection(temp_detector):
+    """Test size_name grouping finds matching files."""
+    detector, db_manager, tmpdir = temp_detector
+
+    _add_record(db_manager, tmpdir / "a" / "report.txt", 2048)
+    _add_record(db_manager, tmpdir / "b" / "report.txt", 2048)
+    _add_record(db_manager, tmpdir / "c" / "other.txt", 4096)
+
+    duplicates = detector.find_duplicates(method="size_name", min_file_size=0)
+
+    assert len(duplicates) == 1
+    group = next(iter(duplicates.values()))
+    assert len(group) == 2
+
+
+def test_size_name_never_hashes(temp_detector):
+    """Test metadata-only detection reads no file content."""
+    detector, db_manager, tmpdir = temp_detector
+
+    _add_record(db_manager, tmpdir / "a" / "report.txt", 2048)
+    _add_record(db_manager, tmpdir / "b" / "report.txt", 2048)
+
+    def fail_hash(path, file_size=None):
+        raise AssertionError(f"size_name detection hashed {path}")
+
+    detector._calculate_file_hash = fail_hash
+    duplicates = detector.find_duplicates(method="size_name", min_file_size=0)
+    assert len(duplicates) == 1
+
+
+def test_exact_content_hashes_only_size_collisions(temp_detector):
+    """Test files with a unique size are ruled out without hashing."""
+    detector, db_manager, tmpdir = temp_detector
+
+    _add_record(db_manager, tmpdir / "a" / "dup.txt", 4, content=b"same")
+    _add_record(db_manager, tmpdir / "b" / "dup2.txt", 4, content=b"same")
+    _add_record(db_manager, tmpdir / "c" / "unique.txt", 6, content=b"unique")
+
+    hashed = []
+    original_hash = detector._calculate_file_hash
+
+    def counting_hash(path, file_size=None):
+        hashed.append(path)
+        return original_hash(path, file_size)
+
+    detector._calculate_file_hash = counting_hash
+    duplicates = detector.find_duplicates(method="exact_content", min_file_size=0)
+
+    assert len(duplicates) == 1
+    assert len(hashed) == 2
+    assert all("unique" not in path for path in hashed)
@@ -0,0 +1,76 @@
+"""Tests for unified file utility functions."""
+
+import hashlib
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from isearch.utils.file_utils import (
+    HASH_BLOCK_SIZE,
+    calculate_file_hash,
+    format_size,
+    format_timestamp,
+    string_similarity,
+)
+
+
+@pytest.fixture
+def temp_dir():
+    """Provide a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def test_format_size():
+    """Test human readable size formatting."""
+    assert format_size(0) == "0.0 B"
+    assert format_size(512) == "512.0 B"
+    assert format_size(1024) == "1.0 KB"
+    assert format_size(1536) == "1.5 KB"
+    assert format_size(1024 * 1024) == "1.0 MB"
+    assert format_size(3 * 1024 * 1024 * 1024) == "3.0 GB"
+
+
+def test_format_timestamp():
+    """Test timestamp formatting has minute resolution."""
+    assert format_timestamp(0) == format_timestamp(59)
+    assert format_timestamp(0) != format_timestamp(60)
+
+
+def test_calculate_file_hash(temp_dir):
+    """Test hashing matches a direct digest, across chunk boundaries."""
+    content = b"x" * (HASH_BLOCK_SIZE + 17)
+    test_file = temp_dir / "data.bin"
+    test_file.write_bytes(content)
+
+    expected = hashlib.sha256(content).digest()
+    assert calculate_file_hash(str(test_file)) == expected
+
+
+def test_calculate_file_hash_respects_max_size(temp_dir):
+    """Test files above max_size are skipped."""
+    test_file = temp_dir / "big.bin"
+    test_file.write_bytes(b"y" * 1024)
+
+    assert calculate_file_hash(str(test_file), max_size=512) is None
+
+
+def test_calculate_file_hash_missing_file(temp_dir):
+    """Test missing files return None instead of raising."""
+    assert calculate_file_hash(str(temp_dir / "nope.bin")) is None
+
+
+def test_string_similarity():
+    """Test similarity scoring basics."""
+    assert string_similarity("photo.jpg", "photo.jpg") == 1.0
+    assert string_similarity("", "") == 1.0
+    assert string_similarity("abc", "") == 0.0
+    assert 0.0 < string_similarity("photo_1.jpg", "photo_2.jpg") <= 1.0
+
+
+def test_string_similarity_threshold_bound():
+    """Test the early-exit bound rejects only provably low scores."""
+    assert string_similarity("abcdefghij", "xy", min_threshold=0.5) == 0.0
+    # Repeated characters: identical sets despite a 4:1 length ratio
+    assert string_similarity("aaaa", "a", min_threshold=0.9) == 1.0
@@ -1,9 +1,7 @@
 """Tests for search engine functionality."""
 
 import pytest
-import tempfile
 import time
-from pathlib import Path
 
 from isearch.core.database import DatabaseManager
 from isearch.core.search_engine import SearchEngine, SearchFilters
@@ -12,46 +10,43 @@ from isearch.core.search_engine import SearchEngine, SearchFilters
 @pytest.fixture
 def search_setup():
     """Create search engine with test data."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        db_manager = DatabaseManager(db_path)
-        search_engine = SearchEngine(db_manager)
-
-        # Add test files
-        test_files = [
-            {
-                "path": "/test/document.txt",
-                "filename": "document.txt",
-                "directory": "/test",
-                "size": 1024,
-                "modified_date": time.time(),
-                "file_type": "document",
-                "extension": ".txt",
-            },
-            {
-                "path": "/test/image.jpg",
-                "filename": "image.jpg",
-                "directory": "/test",
-                "size": 2048,
-                "modified_date": time.time(),
-                "file_type": "image",
-                "extension": ".jpg",
-            },
-            {
-                "path": "/test/backup/duplicate.txt",
-                "filename": "document.txt",  # Same name as first file
-                "directory": "/test/backup",
-                "size": 1024,
-                "modified_date": time.time(),
-                "file_type": "document",
-                "extension": ".txt",
-            },
-        ]
-
-        for file_info in test_files:
-            db_manager.add_file(file_info)
-
-        yield search_engine
+    db_manager = DatabaseManager(":memory:")
+    search_engine = SearchEngine(db_manager)
+
+    # Add test files
+    test_files = [
+        {
+            "path": "/test/document.txt",
+            "filename": "document.txt",
+            "directory": "/test",
+            "size": 1024,
+            "modified_date": time.time(),
+            "file_type": "document",
+            "extension": ".txt",
+        },
+        {
+            "path": "/test/image.jpg",
+            "filename": "image.jpg",
+            "directory": "/test",
+            "size": 2048,
+            "modified_date": time.time(),
+            "file_type": "image",
+            "extension": ".jpg",
+        },
+        {
+            "path": "/test/backup/duplicate.txt",
+            "filename": "document.txt",  # Same name as first file
+            "directory": "/test/backup",
+            "size": 1024,
+            "modified_date": time.time(),
+            "file_type": "document",
+            "extension": ".txt",
+        },
+    ]
+
+    db_manager.add_files(test_files)
+
+    yield search_engine
 
 
 def test_basic_search(search_setup):